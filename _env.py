@@ -0,0 +1,22 @@
+"""
+.env reader shared by the standalone probe scripts (no python-dotenv needed).
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=4)
+def load_env_file(filepath=".env"):
+    """Parse KEY=VALUE lines from a .env file; {} if it doesn't exist. Cached per path."""
+    try:
+        with open(filepath, 'r') as f:
+            text = f.read()
+    except FileNotFoundError:
+        return {}
+    env_vars = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#') and '=' in line:
+            key, value = line.split('=', 1)
+            env_vars[key.strip()] = value.strip()
+    return env_vars
@@ -0,0 +1,64 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Compiled indicator kernels
+==========================
+Ahead-of-time compiled versions of strategy._ema / strategy._rsi.
+No JIT warm-up — fast from the very first tick.
+
+Build (from bot/):
+    python build_indicators.py
+
+strategy.py imports this module if the .so exists and falls back to the
+pure-Python helpers otherwise. Results must stay identical to those helpers.
+"""
+
+from math import fsum
+
+from cpython.array cimport array, clone
+
+
+def ema(double[::1] values, int period):
+    """Calculate Exponential Moving Average (same output as strategy._ema)"""
+    cdef Py_ssize_t n = values.shape[0]
+    cdef Py_ssize_t i
+    cdef double k, one_minus_k, seed, prev
+    cdef array out
+
+    if n < period:
+        return array("d")
+
+    k = 2.0 / (period + 1)
+    one_minus_k = 1.0 - k
+
+    seed = fsum(values[:period]) / period
+
+    out = clone(array("d"), n - period + 1, False)
+    out.data.as_doubles[0] = seed
+    prev = seed
+    for i in range(period, n):
+        prev = values[i] * k + prev * one_minus_k
+        out.data.as_doubles[i - period + 1] = prev
+    return out
+
+
+def rsi(double[::1] closes, int period=14):
+    """Calculate Relative Strength Index (same output as strategy._rsi)"""
+    cdef Py_ssize_t n = closes.shape[0]
+    cdef Py_ssize_t i
+    cdef double d, gain = 0.0, loss = 0.0, avg_gain, avg_loss
+
+    if n < period + 1:
+        return 50.0
+
+    for i in range(n - period, n):
+        d = closes[i] - closes[i - 1]
+        if d > 0:
+            gain += d
+        elif d < 0:
+            loss -= d
+
+    avg_gain = gain / period
+    avg_loss = loss / period
+    if avg_loss == 0:
+        return 100.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
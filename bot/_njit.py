@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT
+==================
+`njit` compiles with numba when it is installed and is a no-op decorator
+otherwise, so modules can decorate kernels unconditionally:
+
+    from _njit import njit, NUMBA_AVAILABLE
+
+    @njit(cache=True)
+    def kernel(arr): ...
+
+Check NUMBA_AVAILABLE before routing hot paths through a kernel — without
+numba the decorated function is a plain Python loop over ndarrays.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Identity decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
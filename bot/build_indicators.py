@@ -0,0 +1,34 @@
+"""
+Build the compiled indicator extension (_indicators.pyx → _indicators.*.so)
+============================================================================
+Optional. Requires Cython and a C compiler:
+
+    pip install cython
+    cd bot && python build_indicators.py
+
+The .so is written next to strategy.py, which picks it up on import.
+Without it, strategy.py uses the pure-Python indicator helpers.
+"""
+
+import os
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+BOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+if __name__ == "__main__":
+    os.chdir(BOT_DIR)
+    setup(
+        name="trading-bot-indicators",
+        ext_modules=cythonize(
+            [Extension("_indicators", ["_indicators.pyx"])],
+            compiler_directives={
+                "boundscheck": False,
+                "wraparound": False,
+                "cdivision": True,
+                "language_level": 3,
+            },
+        ),
+        script_args=["build_ext", "--inplace"],
+    )
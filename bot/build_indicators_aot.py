@@ -0,0 +1,35 @@
+"""
+Numba AOT build of the strategy kernels
+=======================================
+Compiles strategy._ema_loop / _rsi_loop / _atr_loop ahead of time into an
+extension module named `_indicators_aot`, so a bot restart pays no JIT
+compile pause. Requires numba at build time only:
+
+    cd bot && python build_indicators_aot.py
+
+strategy.py prefers the built module over the JIT kernels. Rebuild after
+changing any of the kernels.
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+BOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def build() -> None:
+    sys.path.insert(0, BOT_DIR)
+    import strategy
+
+    cc = CC("_indicators_aot")
+    cc.output_dir = BOT_DIR
+    cc.export("ema", "f8[:](f8[:], i8, f8, f8)")(strategy._ema_loop.py_func)
+    cc.export("rsi", "f8(f8[:], i8)")(strategy._rsi_loop.py_func)
+    cc.export("atr", "f8(f8[:], f8[:], f8[:], i8)")(strategy._atr_loop.py_func)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
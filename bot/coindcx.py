@@ -11,36 +11,62 @@ import requests
 import logging
 from typing import Callable, Optional
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
 logger = logging.getLogger(__name__)
 FUTURES_BASE = "https://api.coindcx.com"
 PUBLIC_BASE  = "https://public.coindcx.com"
 
+def _dumps(body):
+	"""Compact JSON for a request body; orjson when installed (already compact)."""
+	if orjson is not None:
+		return orjson.dumps(body).decode()
+	return json.dumps(body, separators=(",", ":"))
+
+def _loads(resp):
+	"""Decode a JSON response body; orjson parses the raw bytes when installed."""
+	if orjson is not None:
+		return orjson.loads(resp.content)
+	return resp.json()
+
 def _sign(secret, body):
-	json_body = json.dumps(body, separators=(",", ":"))
+	json_body = _dumps(body)
 	return hmac.new(bytes(secret, encoding="utf-8"), json_body.encode(), hashlib.sha256).hexdigest()
 
 def _headers(api_key, signature):
 	return {"Content-Type": "application/json", "X-AUTH-APIKEY": api_key, "X-AUTH-SIGNATURE": signature}
 
 class CoinDCXREST:
-	def __init__(self, api_key, api_secret):
+	def __init__(self, api_key, api_secret, session=None):
 		self.key    = api_key
 		self.secret = api_secret
+		# Optional requests.Session so callers can share a keep-alive pool
+		self._http  = session if session is not None else requests
+		# Keyed once; each request signs a copy instead of re-deriving the pads
+		self._mac   = hmac.new(bytes(api_secret, encoding="utf-8"), digestmod=hashlib.sha256)
 		self._inr_usdt_cache = {"rate": None, "ts": 0}
 
+	def _sign(self, json_body):
+		mac = self._mac.copy()
+		mac.update(json_body.encode())
+		return mac.hexdigest()
+
 	def _post(self, path, body, max_retries=3):
 		"""POST request with retry logic and error handling."""
 		body["timestamp"] = int(time.time() * 1000)
 		# Create signature from JSON string
-		json_body = json.dumps(body, separators=(",", ":"))
-		sig = hmac.new(bytes(self.secret, encoding="utf-8"), json_body.encode(), hashlib.sha256).hexdigest()
+		json_body = _dumps(body)
+		sig = self._sign(json_body)
 		
 		for attempt in range(max_retries):
 			try:
 				# Send the EXACT string that was signed (use data= not json=)
-				resp = requests.post(FUTURES_BASE + path, headers=_headers(self.key, sig), data=json_body, timeout=10)
+				resp = self._http.post(FUTURES_BASE + path, headers=_headers(self.key, sig), data=json_body, timeout=10)
 				resp.raise_for_status()
-				return resp.json()
+				return _loads(resp)
 				
 			except requests.HTTPError as e:
 				if e.response.status_code == 429:  # Rate limit
@@ -65,21 +91,21 @@ class CoinDCXREST:
 				
 		return {"error": "Max retries exceeded"}
 
-	def _get(self, path, body=None, max_retries=3):
+	def _get(self, path, body=None, max_retries=3, timeout=10):
 		"""GET request with retry logic and error handling."""
 		if body is None:
 			body = {}
 		body["timestamp"] = int(time.time() * 1000)
 		# Create signature from JSON string
-		json_body = json.dumps(body, separators=(",", ":"))
-		sig = hmac.new(bytes(self.secret, encoding="utf-8"), json_body.encode(), hashlib.sha256).hexdigest()
+		json_body = _dumps(body)
+		sig = self._sign(json_body)
 		
 		for attempt in range(max_retries):
 			try:
 				# Send the EXACT string that was signed (use data= not json=)
-				resp = requests.get(FUTURES_BASE + path, headers=_headers(self.key, sig), data=json_body, timeout=10)
+				resp = self._http.get(FUTURES_BASE + path, headers=_headers(self.key, sig), data=json_body, timeout=timeout)
 				resp.raise_for_status()
-				return resp.json()
+				return _loads(resp)
 				
 			except requests.HTTPError as e:
 				if e.response.status_code == 429:  # Rate limit
@@ -107,21 +133,32 @@ class CoinDCXREST:
 	def get_candles(self, pair, interval, limit=100):
 		"""Get candles with error handling."""
 		try:
-			resp = requests.get(
+			resp = self._http.get(
 				f"{PUBLIC_BASE}/market_data/candles",
 				params={"pair": pair, "interval": interval, "limit": limit},
 				timeout=10,
 			)
 			resp.raise_for_status()
-			return resp.json()
+			return _loads(resp)
 		except Exception as e:
 			logger.error(f"Failed to get candles for {pair}: {e}")
 			return []
 
 	def get_tickers(self):
-		resp = requests.get(f"{PUBLIC_BASE}/market_data/ticker", timeout=10)
+		resp = self._http.get(f"{PUBLIC_BASE}/market_data/ticker", timeout=10)
 		resp.raise_for_status()
-		return resp.json()
+		return _loads(resp)
+
+	def get_futures_prices(self):
+		"""Current prices for every futures instrument in one call: {pair: {"ls": last, "mp": mark, ...}}."""
+		try:
+			resp = self._http.get(f"{PUBLIC_BASE}/market_data/v3/current_prices/futures/rt", timeout=10)
+			resp.raise_for_status()
+			prices = _loads(resp).get("prices")
+			return prices if isinstance(prices, dict) else {}
+		except Exception as e:
+			logger.error(f"Failed to get futures prices: {e}")
+			return {}
 
 	def get_inr_usdt_rate(self, max_age_sec=60):
 		"""Return INR per 1 USDT using CoinDCX public ticker."""
@@ -189,18 +226,18 @@ class CoinDCXREST:
 		return None
 
 	def get_active_instruments(self):
-		resp = requests.get(f"{FUTURES_BASE}/exchange/v1/derivatives/futures/data/active_instruments", timeout=10)
+		resp = self._http.get(f"{FUTURES_BASE}/exchange/v1/derivatives/futures/data/active_instruments", timeout=10)
 		resp.raise_for_status()
-		return resp.json()
+		return _loads(resp)
 
-	def get_wallet(self):
+	def get_wallet(self, timeout=10, max_retries=3):
 		"""Get futures wallet balance. Returns array of wallet objects."""
 		# Official CoinDCX API endpoint from docs: https://docs.coindcx.com/#wallet-details
 		path = "/exchange/v1/derivatives/futures/wallets"
 		
 		try:
 			# Use GET method as per official docs
-			payload = self._get(path)
+			payload = self._get(path, max_retries=max_retries, timeout=timeout)
 			logger.info(f"Wallet API response: {payload}")
 			return payload
 		except (requests.HTTPError, requests.RequestException) as e:
@@ -295,6 +295,14 @@ def get_enabled_pairs():
     return [dict(r) for r in rows]
 
 
+def get_enabled_pair_names():
+    """Get just the pair symbols that are enabled."""
+    conn = get_conn()
+    rows = conn.execute("SELECT pair FROM pair_config WHERE enabled=1 ORDER BY pair ASC").fetchall()
+    conn.close()
+    return [r["pair"] for r in rows]
+
+
 def upsert_pair_config(pair: str, enabled: int, leverage: int, quantity: float, inr_amount: float):
     """Insert or update pair configuration."""
     conn = get_conn()
@@ -312,6 +320,23 @@ def upsert_pair_config(pair: str, enabled: int, leverage: int, quantity: float,
     conn.close()
 
 
+def upsert_pair_configs_bulk(rows):
+    """Upsert many (pair, enabled, leverage, quantity, inr_amount) rows in one transaction."""
+    conn = get_conn()
+    with conn:
+        conn.executemany("""
+            INSERT INTO pair_config (pair, enabled, leverage, quantity, inr_amount, updated_at)
+            VALUES (?, ?, ?, ?, ?, datetime('now'))
+            ON CONFLICT(pair) DO UPDATE SET
+                enabled=excluded.enabled,
+                leverage=excluded.leverage,
+                quantity=excluded.quantity,
+                inr_amount=excluded.inr_amount,
+                updated_at=datetime('now')
+        """, rows)
+    conn.close()
+
+
 def update_pair_enabled(pair: str, enabled: int):
     """Toggle pair enabled/disabled status."""
     conn = get_conn()
@@ -326,6 +351,17 @@ def update_pair_enabled(pair: str, enabled: int):
     conn.close()
 
 
+def bulk_set_enabled(pairs, enabled: int):
+    """Set enabled/disabled for many pairs in one transaction."""
+    conn = get_conn()
+    with conn:
+        conn.executemany(
+            "UPDATE pair_config SET enabled=?, updated_at=datetime('now') WHERE pair=?",
+            [(enabled, pair) for pair in pairs],
+        )
+    conn.close()
+
+
 # ── Trading mode ────────────────────────────
 def get_trading_mode() -> str:
     conn = get_conn()
@@ -375,6 +411,94 @@ def init_paper_wallet_if_missing(balance: float):
         set_paper_wallet_balance(balance)
 
 
+# ── Dashboard status ────────────────────────
+def get_status_bundle():
+    """Open trade count, trading mode and paper balance in one query."""
+    conn = get_conn()
+    row = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM trades WHERE status='open') AS open_trades,
+            (SELECT mode FROM trading_mode WHERE id=1)        AS mode,
+            (SELECT balance FROM paper_wallet WHERE id=1)     AS paper_balance
+    """).fetchone()
+    conn.close()
+    return {
+        "open_trades":   row["open_trades"],
+        "mode":          row["mode"] or "REAL",
+        "paper_balance": row["paper_balance"],
+    }
+
+
+# ── Table versions (HTTP ETags) ─────────────
+# Rows are only ever appended, and trades change once more when they close,
+# so (row count, max id, closed count) changes whenever a listing would.
+_TABLE_VERSION_SQL = {
+    "trades":                 "SELECT COUNT(*), COALESCE(MAX(id), 0), COUNT(closed_at) FROM trades",
+    "paper_trades":           "SELECT COUNT(*), COALESCE(MAX(id), 0), COUNT(closed_at) FROM paper_trades",
+    "equity_snapshots":       "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM equity_snapshots",
+    "paper_equity_snapshots": "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM paper_equity_snapshots",
+    "bot_log":                "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM bot_log",
+}
+
+
+def get_table_version(table: str) -> str:
+    """Cheap change marker for an append-only table, e.g. '120-131-97'."""
+    conn = get_conn()
+    row = conn.execute(_TABLE_VERSION_SQL[table]).fetchone()
+    conn.close()
+    return "-".join(str(v) for v in row)
+
+
+# ── Per-pair trade stats ────────────────────
+def _trades_table(mode: str) -> str:
+    return "paper_trades" if mode == "PAPER" else "trades"
+
+
+def get_trade_stats_by_pair(mode: str, limit=100):
+    """Per-pair aggregates over the `limit` most recent trades, plus those rows.
+
+    Returns (stats, rows): stats maps pair -> aggregate dict, rows are the
+    recent trades newest first, same as get_all_trades / get_all_paper_trades.
+    """
+    table = _trades_table(mode)
+    conn = get_conn()
+    # One read transaction, so the aggregates and rows see the same snapshot
+    # even if the bot inserts a trade in between
+    conn.execute("BEGIN")
+    stats = conn.execute(f"""
+        SELECT pair,
+               COUNT(*)                                                  AS total_trades,
+               COUNT(CASE WHEN status='open' THEN 1 END)                 AS open_trades,
+               TOTAL(confidence)                                         AS total_confidence,
+               TOTAL(CASE WHEN status='closed' THEN pnl END)             AS total_pnl,
+               COUNT(CASE WHEN status='closed' AND pnl > 0 THEN 1 END)   AS wins
+        FROM (SELECT * FROM {table} ORDER BY opened_at DESC, id DESC LIMIT ?)
+        GROUP BY pair
+    """, (limit,)).fetchall()
+    rows = conn.execute(
+        f"SELECT * FROM {table} ORDER BY opened_at DESC, id DESC LIMIT ?", (limit,)
+    ).fetchall()
+    conn.commit()
+    conn.close()
+    return {r["pair"]: dict(r) for r in stats}, [dict(r) for r in rows]
+
+
+def get_open_trade_stats_by_pair(mode: str):
+    """Per-pair open position count and confidence sum, plus the open trades."""
+    table = _trades_table(mode)
+    conn = get_conn()
+    conn.execute("BEGIN")  # same snapshot for aggregates and rows
+    stats = conn.execute(f"""
+        SELECT pair, COUNT(*) AS open_positions, TOTAL(confidence) AS total_confidence
+        FROM {table} WHERE status='open'
+        GROUP BY pair
+    """).fetchall()
+    rows = conn.execute(f"SELECT * FROM {table} WHERE status='open'").fetchall()
+    conn.commit()
+    conn.close()
+    return {r["pair"]: dict(r) for r in stats}, [dict(r) for r in rows]
+
+
 # ── Paper trades ────────────────────────────
 def insert_paper_trade(pair, side, entry_price, quantity, leverage, tp_price, sl_price,
                        fee_paid=0.0, order_id="", position_id="", strategy_name="enhanced_v2", strategy_note="", confidence=0.0,
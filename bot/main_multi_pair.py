@@ -99,6 +99,7 @@ def _init_pair_data():
         pair_data = {
             p["pair"]: {
                 "candles": [],
+                "state": strategy.StrategyState(),
                 "config": p,
                 "open_trades": []
             }
@@ -278,7 +279,7 @@ def _run_strategy(pair: str, current_price: float):
     candle_buffer = pair_data[pair]["candles"]
     
     # Get signal with confidence
-    result = strategy.evaluate(candle_buffer, return_confidence=True)
+    result = strategy.evaluate(candle_buffer, return_confidence=True, state=pair_data[pair]["state"])
     if not result or result["signal"] is None:
         return
 
@@ -0,0 +1,6 @@
+"""
+Trading strategy plugins.
+
+Every module in this package is imported by StrategyManager, which registers
+the TradingStrategy subclasses it defines.
+"""
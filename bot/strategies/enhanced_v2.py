@@ -10,8 +10,7 @@ Advanced trading strategy with:
 """
 
 import logging
-import statistics
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Union
 from strategy_base import TradingStrategy
 
 logger = logging.getLogger(__name__)
@@ -22,6 +21,8 @@ class EnhancedStrategyV2(TradingStrategy):
     Enhanced trading strategy with advanced indicators and risk management.
     """
 
+    __slots__ = ()
+
     CONFIG = {
         "pair":          "B-BTC_USDT",      # Trading pair
         "interval":      "5m",              # Candle interval
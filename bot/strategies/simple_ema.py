@@ -6,7 +6,7 @@ Good for beginners and testing.
 """
 
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Union
 from strategy_base import TradingStrategy
 
 logger = logging.getLogger(__name__)
@@ -17,6 +17,8 @@ class SimpleEMAStrategy(TradingStrategy):
     Simple EMA crossover strategy with basic RSI filter.
     """
 
+    __slots__ = ()
+
     CONFIG = {
         "pair":          "B-BTC_USDT",
         "interval":      "5m",
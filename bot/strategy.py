@@ -18,12 +18,36 @@ Returns:
 Candles format (list of dicts, newest last):
     { open, high, low, close, volume, timestamp }
 
-CONFIG block at the top is what you tune.
+CONFIG block at the top is what you tune (call reload_config() after changing it at runtime).
 Everything below compute_indicators() is the signal logic — edit freely.
 """
 
 import logging
-import statistics
+import math
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # scipy is optional — fall back to a plain recurrence
+    lfilter = None
+
+try:
+    import _indicators  # compiled EMA/RSI kernels (see build_indicators.py)
+except ImportError:
+    _indicators = None
+
+try:
+    import _indicators_aot  # numba AOT build of the JIT kernels (see build_indicators_aot.py)
+except ImportError:
+    _indicators_aot = None
+
+from _njit import njit, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -68,66 +92,252 @@ CONFIG = {
     "volatility_adjusted": True,       # Use ATR for position sizing
     "min_position_size": 0.0005,       # Minimum BTC to trade
     "max_position_size": 0.01,         # Maximum BTC to trade
+
+    # ── Compute ──────
+    "use_float32":   False,            # Store candle columns as float32 (halves bandwidth for ATR/volume MA)
 }
 
+# Memo for compute_indicators: the same candle list is often evaluated
+# several times per tick (signal strength → evaluate → proximity).
+_IND_CACHE: OrderedDict = OrderedDict()
+_IND_CACHE_SIZE = 128
+_IND_CACHE_LOCK = threading.Lock()
+
+# Bumped by reload_config(); StrategyState rebuilds when it was built under an
+# older generation, since its windows/periods came from the old constants
+_CONFIG_GENERATION = 0
+
+
+# ─────────────────────────────────────────────
+#  Hot-path constants (bound from CONFIG)
+# ─────────────────────────────────────────────
+def _candle_dtype(float_type) -> np.dtype:
+    """
+    Candle layout for the indicator pass — candles[...]["close"] etc. are
+    zero-copy column views. Timestamps are not needed by any indicator.
+    """
+    return np.dtype([
+        ("open",   float_type),
+        ("high",   float_type),
+        ("low",    float_type),
+        ("close",  float_type),
+        ("volume", float_type),
+    ])
+
+
+def reload_config() -> None:
+    """
+    Re-bind the module-level constants below from CONFIG.
+
+    Indicator/signal code reads these instead of CONFIG[...] lookups, so
+    call this after changing CONFIG at runtime. Also drops memoized indicators
+    and makes every StrategyState rebuild on its next update().
+    """
+    global ATR_MULTIPLIER, ATR_PERIOD, AUTO_EXECUTE, CONFIDENCE_THRESHOLD, EMA_FAST, EMA_SLOW, \
+        MACD_FAST, MACD_SIGNAL, MACD_SLOW, MAX_POSITION_SIZE, MIN_POSITION_SIZE, MIN_VOLUME_RATIO, \
+        QUANTITY, RSI_OVERBOUGHT, RSI_OVERSOLD, RSI_PERIOD, SL_PCT, TP_PCT, \
+        VOLATILITY_ADJUSTED, VOLUME_MA_PERIOD, MIN_CANDLES, \
+        USE_FLOAT32, CANDLE_DTYPE, _CONFIG_GENERATION
+    ATR_MULTIPLIER = CONFIG["atr_multiplier"]
+    ATR_PERIOD = CONFIG["atr_period"]
+    AUTO_EXECUTE = CONFIG["auto_execute"]
+    CONFIDENCE_THRESHOLD = CONFIG["confidence_threshold"]
+    EMA_FAST = CONFIG["ema_fast"]
+    EMA_SLOW = CONFIG["ema_slow"]
+    MACD_FAST = CONFIG["macd_fast"]
+    MACD_SIGNAL = CONFIG["macd_signal"]
+    MACD_SLOW = CONFIG["macd_slow"]
+    MAX_POSITION_SIZE = CONFIG["max_position_size"]
+    MIN_POSITION_SIZE = CONFIG["min_position_size"]
+    MIN_VOLUME_RATIO = CONFIG["min_volume_ratio"]
+    QUANTITY = CONFIG["quantity"]
+    RSI_OVERBOUGHT = CONFIG["rsi_overbought"]
+    RSI_OVERSOLD = CONFIG["rsi_oversold"]
+    RSI_PERIOD = CONFIG["rsi_period"]
+    SL_PCT = CONFIG["sl_pct"]
+    TP_PCT = CONFIG["tp_pct"]
+    VOLATILITY_ADJUSTED = CONFIG["volatility_adjusted"]
+    VOLUME_MA_PERIOD = CONFIG["volume_ma_period"]
+    MIN_CANDLES = max(EMA_SLOW, MACD_SLOW) + 5
+    USE_FLOAT32 = CONFIG.get("use_float32", False)
+    # float32 only affects storage and the ATR/volume reductions; EMA/RSI/MACD
+    # kernels upcast closes to float64 since crossovers compare near-equal EMAs
+    CANDLE_DTYPE = _candle_dtype(np.float32 if USE_FLOAT32 else np.float64)
+    with _IND_CACHE_LOCK:
+        _IND_CACHE.clear()
+    _CONFIG_GENERATION += 1
+
+
+reload_config()
+
+
+def to_candle_array(candles: "list[dict] | np.ndarray") -> np.ndarray:
+    """Pack candle dicts into a CANDLE_DTYPE array in one pass (arrays pass through)."""
+    if isinstance(candles, np.ndarray):
+        return candles
+    return np.fromiter(
+        ((c["open"], c["high"], c["low"], c["close"], c["volume"]) for c in candles),
+        dtype=CANDLE_DTYPE,
+        count=len(candles),
+    )
+
+
+# ─────────────────────────────────────────────
+#  JIT kernels (used only when numba or its AOT build is available)
+# ─────────────────────────────────────────────
+@njit(cache=True, nogil=True, fastmath={"contract"})
+def _ema_loop(arr, period, k, one_minus_k):
+    """EMA series starting at the seed bar (len(arr) - period + 1 values)."""
+    n = arr.shape[0]
+    out = np.empty(n - period + 1)
+
+    # Neumaier-compensated seed sum (stand-in for math.fsum)
+    total = 0.0
+    comp = 0.0
+    for i in range(period):
+        t = total + arr[i]
+        if abs(total) >= abs(arr[i]):
+            comp += (total - t) + arr[i]
+        else:
+            comp += (arr[i] - t) + total
+        total = t
+    prev = (total + comp) / period
+
+    out[0] = prev
+    for i in range(period, n):
+        prev = arr[i] * k + prev * one_minus_k
+        out[i - period + 1] = prev
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _rsi_loop(arr, period):
+    """Unrounded RSI over the last `period` deltas of arr."""
+    n = arr.shape[0]
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        d = arr[i] - arr[i - 1]
+        if d > 0:
+            gain += d
+        else:
+            loss -= d
+    if loss == 0:
+        return 100.0
+    return 100.0 - (100.0 / (1.0 + gain / loss))
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _atr_loop(highs, lows, closes, period):
+    """SMA of the last `period` true ranges."""
+    n = closes.shape[0]
+    total = 0.0
+    for i in range(n - period, n):
+        close_prev = closes[i - 1] if i > 0 else closes[i]
+        total += max(highs[i] - lows[i],
+                     abs(highs[i] - close_prev),
+                     abs(lows[i] - close_prev))
+    return total / period
+
+
+# Kernel selection: AOT build (no compile pause) > JIT > none (NumPy/Python paths)
+if _indicators_aot is not None:
+    _ema_kernel = _indicators_aot.ema
+    _rsi_kernel = _indicators_aot.rsi
+    _atr_kernel = _indicators_aot.atr
+elif NUMBA_AVAILABLE:
+    # Compile (or load from cache) now so the first evaluate() doesn't stall
+    _warm = np.arange(1.0, 5.0)
+    _ema_loop(_warm, 2, 2 / 3, 1 / 3)
+    _rsi_loop(_warm, 2)
+    _atr_loop(_warm, _warm, _warm, 2)
+    del _warm
+    _ema_kernel = _ema_loop
+    _rsi_kernel = _rsi_loop
+    _atr_kernel = _atr_loop
+else:
+    _ema_kernel = _rsi_kernel = _atr_kernel = None
+
 
 # ─────────────────────────────────────────────
 #  Indicator helpers
 # ─────────────────────────────────────────────
-def _ema(values: list[float], period: int) -> list[float]:
-    """Calculate Exponential Moving Average"""
+# EMA smoothing constants (k, 1 - k) per period
+_EMA_K_CACHE: dict[int, tuple[float, float]] = {}
+
+
+def _ema_k(period: int) -> tuple[float, float]:
+    pair = _EMA_K_CACHE.get(period)
+    if pair is None:
+        k = 2 / (period + 1)
+        pair = _EMA_K_CACHE[period] = (k, 1 - k)
+    return pair
+
+
+def _ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Calculate Exponential Moving Average (series starting at the seed bar)"""
     if len(values) < period:
-        return []
-    k = 2 / (period + 1)
-    ema = [sum(values[:period]) / period]
+        return np.empty(0)
+    if _indicators is not None:
+        return np.asarray(_indicators.ema(np.ascontiguousarray(values, dtype=np.float64), period))
+    k, one_minus_k = _ema_k(period)
+    if _ema_kernel is not None:
+        # Candle fields are strided views of the structured array; the kernels
+        # are compiled (and warmed) for C-contiguous input only
+        return _ema_kernel(np.ascontiguousarray(values, dtype=np.float64), period, k, one_minus_k)
+    if lfilter is not None:
+        # Recurrence runs in C inside lfilter; drop the NaN warm-up bars
+        return _ema_vec(np.asarray(values, dtype=np.float64), period)[period - 1:]
+    # fsum: exact seed, so rounding error doesn't compound through the recursion
+    ema = [math.fsum(values[:period]) / period]
     for v in values[period:]:
-        ema.append(v * k + ema[-1] * (1 - k))
-    return ema
+        ema.append(v * k + ema[-1] * one_minus_k)
+    return np.array(ema)
 
 
 def _rsi(closes: list[float], period: int = 14) -> float:
     """Calculate Relative Strength Index"""
     if len(closes) < period + 1:
         return 50.0
-    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-    gains  = [d if d > 0 else 0 for d in deltas[-period:]]
-    losses = [-d if d < 0 else 0 for d in deltas[-period:]]
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
+    if _indicators is not None:
+        return _indicators.rsi(np.ascontiguousarray(closes, dtype=np.float64), period)
+    if _rsi_kernel is not None:
+        return _rsi_kernel(np.ascontiguousarray(closes[-(period + 1):], dtype=np.float64), period)
+    deltas = np.diff(np.asarray(closes[-(period + 1):], dtype=np.float64))
+    avg_gain = float(np.clip(deltas, 0, None).sum()) / period
+    avg_loss = float(np.clip(-deltas, 0, None).sum()) / period
     if avg_loss == 0:
         return 100.0
     rs = avg_gain / avg_loss
-    return round(100 - (100 / (1 + rs)), 2)
+    return 100 - (100 / (1 + rs))
 
 
-def _atr(candles: list[dict], period: int = 14) -> float:
+def _atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> float:
     """Calculate Average True Range for volatility"""
-    if len(candles) < period:
+    if len(closes) < period:
         return 0.0
     
-    true_ranges = []
-    for i in range(len(candles)):
-        high = candles[i]["high"]
-        low = candles[i]["low"]
-        close_prev = candles[i-1]["close"] if i > 0 else candles[i]["close"]
-        
-        tr = max(
-            high - low,
-            abs(high - close_prev),
-            abs(low - close_prev)
+    if _atr_kernel is not None and closes.dtype == np.float64:
+        return _atr_kernel(
+            np.ascontiguousarray(highs), np.ascontiguousarray(lows), np.ascontiguousarray(closes), period
         )
-        true_ranges.append(tr)
-    
-    # Use SMA of true ranges
-    atr = sum(true_ranges[-period:]) / period
-    return round(atr, 4)
+
+    # Only the last `period` true ranges feed the SMA (in the candles' own dtype)
+    h = highs[-period:]
+    l = lows[-period:]
+    prev_close = np.empty(period, dtype=closes.dtype)
+    prev_close[1:] = closes[-period:-1]
+    prev_close[0] = closes[-period - 1] if len(closes) > period else closes[0]
+
+    tr = np.maximum.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+    return float(tr.sum()) / period
 
 
-def _macd(closes: list[float]) -> dict:
+def _macd(closes: np.ndarray) -> dict:
     """Calculate MACD (Moving Average Convergence Divergence)"""
-    fast_period = CONFIG["macd_fast"]
-    slow_period = CONFIG["macd_slow"]
-    signal_period = CONFIG["macd_signal"]
+    fast_period = MACD_FAST
+    slow_period = MACD_SLOW
+    signal_period = MACD_SIGNAL
     
     if len(closes) < slow_period + signal_period:
         return {"macd": 0.0, "signal": 0.0, "histogram": 0.0}
@@ -136,27 +346,27 @@ def _macd(closes: list[float]) -> dict:
     ema_slow = _ema(closes, slow_period)
     
     # Ensure both EMAs have enough data
-    min_len = min(len(ema_fast), len(ema_slow))
-    if min_len == 0:
+    n = min(len(ema_fast), len(ema_slow))
+    if n == 0:
         return {"macd": 0.0, "signal": 0.0, "histogram": 0.0}
     
-    # MACD line = fast EMA - slow EMA
-    macd_line = [ema_fast[i] - ema_slow[i] for i in range(len(ema_slow))]
+    # MACD line = fast EMA - slow EMA, both taken at the same (latest n) bars
+    macd_line = ema_fast[-n:] - ema_slow[-n:]
     
     # Signal line = EMA of MACD
     signal_line = _ema(macd_line, signal_period)
     
-    if not signal_line:
-        return {"macd": macd_line[-1] if macd_line else 0.0, "signal": 0.0, "histogram": 0.0}
+    if not len(signal_line):
+        return {"macd": float(macd_line[-1]), "signal": 0.0, "histogram": 0.0}
     
-    current_macd = macd_line[-1]
-    current_signal = signal_line[-1]
+    current_macd = float(macd_line[-1])
+    current_signal = float(signal_line[-1])
     histogram = current_macd - current_signal
     
     return {
-        "macd": round(current_macd, 4),
-        "signal": round(current_signal, 4),
-        "histogram": round(histogram, 4)
+        "macd": current_macd,
+        "signal": current_signal,
+        "histogram": histogram
     }
 
 
@@ -164,68 +374,310 @@ def _volume_ma(volumes: list[float], period: int = 20) -> float:
     """Calculate Volume Moving Average"""
     if len(volumes) < period:
         return 0.0
-    return sum(volumes[-period:]) / period
+    return math.fsum(volumes[-period:]) / period
+
+
+class Indicators(NamedTuple):
+    """Indicator snapshot returned by compute_indicators() (attribute access, no key hashing)."""
+    # EMA Indicators
+    ema_fast: float | None
+    ema_slow: float | None
+    ema_fast_prev: float | None
+    ema_slow_prev: float | None
+    ema_fast_series: np.ndarray
+    ema_slow_series: np.ndarray
+
+    # RSI
+    rsi: float
 
+    # Volatility (ATR)
+    atr: float
 
-def compute_indicators(candles: list[dict]) -> dict:
+    # MACD
+    macd: float
+    macd_signal: float
+    macd_histogram: float
+
+    # Volume
+    volume: float
+    volume_ma: float
+    volume_ratio: float
+
+    # Price
+    last_close: float | None
+    last_high: float | None
+    last_low: float | None
+
+
+def compute_indicators(candles: "list[dict] | np.ndarray") -> Indicators | None:
     """
     Compute all indicators from candles.
     Includes: EMA, RSI, ATR, MACD, Volume analysis
+
+    Returns None (before any indicator work) when there are too few candles
+    for a previous slow EMA value — no crossover can be detected then.
+
+    Accepts candle dicts or a CANDLE_DTYPE array (used as-is, no copy).
+
+    Results are memoized per candle list: a hit requires the same list
+    object, length, and newest candle object (timestamp included in the key),
+    so appending or replacing the newest candle invalidates the entry.
+    Arrays are not memoized since they may be mutated in place.
     """
-    closes = [c["close"] for c in candles]
-    highs = [c["high"] for c in candles]
-    lows = [c["low"] for c in candles]
-    volumes = [c["volume"] for c in candles]
+    if len(candles) < EMA_SLOW + 2:
+        return None
+    if isinstance(candles, np.ndarray):
+        return _compute_indicators(candles)
+
+    last = candles[-1]
+    key = (id(candles), len(candles), last.get("timestamp"))
+    with _IND_CACHE_LOCK:
+        hit = _IND_CACHE.get(key)
+        if hit is not None and hit[0] is candles and hit[1] is last:
+            _IND_CACHE.move_to_end(key)
+            return hit[2]
+
+    ind = _compute_indicators(candles)
+
+    with _IND_CACHE_LOCK:
+        # Holding the list reference keeps id(candles) from being reused
+        _IND_CACHE[key] = (candles, last, ind)
+        if len(_IND_CACHE) > _IND_CACHE_SIZE:
+            _IND_CACHE.popitem(last=False)
+    return ind
+
+
+def _compute_indicators(candles: "list[dict] | np.ndarray") -> Indicators:
+    """Uncached indicator pass behind compute_indicators()."""
+    arr = to_candle_array(candles)
+    closes = arr["close"]
+    highs = arr["high"]
+    lows = arr["low"]
+    volumes = arr["volume"]
 
     # Trend Indicators
-    ema_fast_series = _ema(closes, CONFIG["ema_fast"])
-    ema_slow_series = _ema(closes, CONFIG["ema_slow"])
-    rsi = _rsi(closes, CONFIG["rsi_period"])
+    ema_fast_series = _ema(closes, EMA_FAST)
+    ema_slow_series = _ema(closes, EMA_SLOW)
+    rsi = _rsi(closes, RSI_PERIOD)
     
     # Volatility Indicator
-    atr = _atr(candles, CONFIG["atr_period"])
+    atr = _atr(highs, lows, closes, ATR_PERIOD)
     
     # Momentum Indicator
     macd_data = _macd(closes)
     
     # Volume Analysis
-    volume_ma = _volume_ma(volumes, CONFIG["volume_ma_period"])
-    current_volume = volumes[-1] if volumes else 0
+    volume_ma = _volume_ma(volumes, VOLUME_MA_PERIOD)
+    current_volume = float(volumes[-1]) if len(volumes) else 0
     volume_ratio = (current_volume / volume_ma) if volume_ma > 0 else 0
 
-    return {
-        # EMA Indicators
-        "ema_fast":    ema_fast_series[-1] if ema_fast_series else None,
-        "ema_slow":    ema_slow_series[-1] if ema_slow_series else None,
-        "ema_fast_prev": ema_fast_series[-2] if len(ema_fast_series) >= 2 else None,
-        "ema_slow_prev": ema_slow_series[-2] if len(ema_slow_series) >= 2 else None,
-        "ema_fast_series": ema_fast_series,
-        "ema_slow_series": ema_slow_series,
-        
-        # RSI
-        "rsi":         rsi,
-        
-        # Volatility (ATR)
-        "atr":         atr,
-        
-        # MACD
-        "macd":        macd_data["macd"],
-        "macd_signal": macd_data["signal"],
-        "macd_histogram": macd_data["histogram"],
-        
-        # Volume
-        "volume":       current_volume,
-        "volume_ma":    volume_ma,
-        "volume_ratio": volume_ratio,
-        
-        # Price
-        "last_close":  closes[-1] if closes else None,
-        "last_high":   highs[-1] if highs else None,
-        "last_low":    lows[-1] if lows else None,
-    }
+    return Indicators(
+        ema_fast=float(ema_fast_series[-1]) if len(ema_fast_series) else None,
+        ema_slow=float(ema_slow_series[-1]) if len(ema_slow_series) else None,
+        ema_fast_prev=float(ema_fast_series[-2]) if len(ema_fast_series) >= 2 else None,
+        ema_slow_prev=float(ema_slow_series[-2]) if len(ema_slow_series) >= 2 else None,
+        ema_fast_series=ema_fast_series,
+        ema_slow_series=ema_slow_series,
+        rsi=rsi,
+        atr=atr,
+        macd=macd_data["macd"],
+        macd_signal=macd_data["signal"],
+        macd_histogram=macd_data["histogram"],
+        volume=current_volume,
+        volume_ma=volume_ma,
+        volume_ratio=volume_ratio,
+        last_close=float(closes[-1]) if len(closes) else None,
+        last_high=float(highs[-1]) if len(highs) else None,
+        last_low=float(lows[-1]) if len(lows) else None,
+    )
+
+
+# ─────────────────────────────────────────────
+#  Streaming indicator state (O(1) per candle)
+# ─────────────────────────────────────────────
+class _EmaState:
+    """EMA seeded with the SMA of the first `period` values, then k*x + (1-k)*ema."""
+    __slots__ = ("period", "k", "one_minus_k", "value", "_seed")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.k, self.one_minus_k = _ema_k(period)
+        self.value = None
+        self._seed = []
+
+    def update(self, x: float) -> float | None:
+        if self.value is None:
+            self._seed.append(x)
+            if len(self._seed) == self.period:
+                self.value = math.fsum(self._seed) / self.period
+                self._seed = []
+            return self.value
+        self.value = x * self.k + self.value * self.one_minus_k
+        return self.value
+
+
+class _WindowSum:
+    """Sum of the last `period` values; re-summed exactly once per window to stop drift."""
+    __slots__ = ("period", "window", "total", "_since_resync")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+        self._since_resync = 0
+
+    def update(self, x: float) -> None:
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(x)
+        self.total += x
+        self._since_resync += 1
+        if self._since_resync >= self.period:
+            self.total = math.fsum(self.window)
+            self._since_resync = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.window) == self.period
+
+
+class StrategyState:
+    """
+    Per-pair incremental indicators.
+
+    Keep one instance per pair and pass it to evaluate(candles, state=...):
+    only candles newer than the last one seen are folded in, so a tick
+    costs O(number of indicators) instead of O(len(candles)).
+
+    Falls back to a full rebuild when the state is cold, when the candle
+    list no longer contains the last candle seen (gap), when that
+    candle was rewritten (e.g. an in-progress candle updated in place;
+    a copy is kept, so in-place edits are detected too), or after
+    reload_config().
+
+    Unlike compute_indicators(), EMA/MACD continue across the whole stream
+    rather than re-seeding at the start of a rolling buffer, and the
+    ema_*_series fields are not tracked (empty arrays).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.generation = _CONFIG_GENERATION
+        self.count = 0
+        self.last_candle = None
+        self.ema_fast = _EmaState(EMA_FAST)
+        self.ema_slow = _EmaState(EMA_SLOW)
+        self.ema_fast_prev = None
+        self.ema_slow_prev = None
+        self.macd_fast = _EmaState(MACD_FAST)
+        self.macd_slow = _EmaState(MACD_SLOW)
+        self.macd_signal = _EmaState(MACD_SIGNAL)
+        self.macd_line = None
+        self.gains = _WindowSum(RSI_PERIOD)
+        self.losses = _WindowSum(RSI_PERIOD)
+        self.true_ranges = _WindowSum(ATR_PERIOD)
+        self.volumes = _WindowSum(VOLUME_MA_PERIOD)
+
+    def _new_candles(self, candles: list[dict]) -> list[dict] | None:
+        """Candles after the last one folded in, or None if a rebuild is needed."""
+        if self.last_candle is None:
+            return None
+        last_ts = self.last_candle["timestamp"]
+        i = len(candles) - 1
+        while i >= 0 and candles[i]["timestamp"] != last_ts:
+            i -= 1
+        if i < 0 or candles[i] != self.last_candle:
+            return None
+        return candles[i + 1:]
+
+    def _fold(self, candle: dict) -> None:
+        close = candle["close"]
+        high = candle["high"]
+        low = candle["low"]
+        close_prev = self.last_candle["close"] if self.last_candle is not None else close
+
+        self.ema_fast_prev = self.ema_fast.value
+        self.ema_slow_prev = self.ema_slow.value
+        self.ema_fast.update(close)
+        self.ema_slow.update(close)
+
+        fast = self.macd_fast.update(close)
+        slow = self.macd_slow.update(close)
+        if fast is not None and slow is not None:
+            self.macd_line = fast - slow
+            self.macd_signal.update(self.macd_line)
+
+        if self.last_candle is not None:
+            delta = close - close_prev
+            self.gains.update(delta if delta > 0 else 0)
+            self.losses.update(-delta if delta < 0 else 0)
+
+        self.true_ranges.update(max(high - low, abs(high - close_prev), abs(low - close_prev)))
+        self.volumes.update(candle["volume"])
+
+        self.count += 1
+        self.last_candle = candle
+
+    def update(self, candles: list[dict]) -> Indicators | None:
+        """Fold in new candles and return the current indicators (None while warming up)."""
+        if not candles:
+            return None
+        new = self._new_candles(candles) if self.generation == _CONFIG_GENERATION else None
+        if new is None:
+            self.reset()
+            new = candles
+        for candle in new:
+            self._fold(candle)
+        # Snapshot the newest candle: the caller may mutate it in place later
+        if new:
+            self.last_candle = dict(self.last_candle)
+        return self.indicators()
+
+    def indicators(self) -> Indicators | None:
+        """Indicator snapshot in the same shape as compute_indicators()."""
+        if self.count < EMA_SLOW + 2:
+            return None
+
+        rsi = 50.0
+        if self.gains.full:
+            avg_gain = self.gains.total / self.gains.period
+            avg_loss = self.losses.total / self.losses.period
+            rsi = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+
+        atr = self.true_ranges.total / self.true_ranges.period if self.true_ranges.full else 0.0
+
+        macd = signal = 0.0
+        if self.count >= MACD_SLOW + MACD_SIGNAL and self.macd_signal.value is not None:
+            macd = self.macd_line
+            signal = self.macd_signal.value
 
+        volume_ma = self.volumes.total / self.volumes.period if self.volumes.full else 0.0
+        current_volume = self.last_candle["volume"]
 
-def calculate_confidence(ind: dict, position_type: str) -> float:
+        return Indicators(
+            ema_fast=self.ema_fast.value,
+            ema_slow=self.ema_slow.value,
+            ema_fast_prev=self.ema_fast_prev,
+            ema_slow_prev=self.ema_slow_prev,
+            ema_fast_series=np.empty(0),
+            ema_slow_series=np.empty(0),
+            rsi=rsi,
+            atr=atr,
+            macd=macd,
+            macd_signal=signal,
+            macd_histogram=macd - signal,
+            volume=current_volume,
+            volume_ma=volume_ma,
+            volume_ratio=(current_volume / volume_ma) if volume_ma > 0 else 0,
+            last_close=self.last_candle["close"],
+            last_high=self.last_candle["high"],
+            last_low=self.last_candle["low"],
+        )
+
+
+def calculate_confidence(ind: Indicators, position_type: str) -> float:
     """
     Calculate strategy confidence (0-100%) based on multiple indicator alignment.
     
@@ -236,91 +688,53 @@ def calculate_confidence(ind: dict, position_type: str) -> float:
     - Volume confirmation (15%)
     - Trend strength - EMA separation (10%)
     
+    Returns 0.0 when the fast EMA is not on the position's side of the slow EMA.
+
     Args:
         position_type: "LONG" or "SHORT"
     """
-    confidence = 0.0
-    
-    if not ind.get("ema_fast") or not ind.get("ema_slow"):
+    if not ind.ema_fast or not ind.ema_slow:
         return 0.0
-    
-    # 1. EMA Crossover & Trend (30% weight)
-    ema_diff = abs(ind["ema_fast"] - ind["ema_slow"])
-    ema_separation = abs(ind["ema_slow"] - ind["ema_fast"]) if ind["ema_slow"] else 0.01
-    
-    if position_type == "LONG":
-        # LONG: fast EMA above slow EMA = uptrend
-        if ind["ema_fast"] > ind["ema_slow"]:
-            confidence += 30
-            # Extra bonus for fresh crossover
-            if (ind["ema_fast_prev"] and ind["ema_slow_prev"] and
-                ind["ema_fast_prev"] <= ind["ema_slow_prev"]):
-                confidence += 5  # Fresh crossover bonus
-    else:
-        # SHORT: fast EMA below slow EMA = downtrend
-        if ind["ema_fast"] < ind["ema_slow"]:
-            confidence += 30
-            # Extra bonus for fresh crossover
-            if (ind["ema_fast_prev"] and ind["ema_slow_prev"] and
-                ind["ema_fast_prev"] >= ind["ema_slow_prev"]):
-                confidence += 5  # Fresh crossover bonus
-    
-    # 2. MACD Confirmation (25% weight)
-    macd_hist = ind.get("macd_histogram", 0)
-    macd = ind.get("macd", 0)
-    macd_signal = ind.get("macd_signal", 0)
-    
-    if position_type == "LONG":
-        # LONG: MACD > signal & positive histogram
-        if macd > macd_signal and macd_hist > 0:
-            confidence += 25
-        elif macd > macd_signal:
-            confidence += 12.5
-    else:
-        # SHORT: MACD < signal & negative histogram
-        if macd < macd_signal and macd_hist < 0:
-            confidence += 25
-        elif macd < macd_signal:
-            confidence += 12.5
-    
-    # 3. RSI Alignment (20% weight) - Relaxed thresholds
-    rsi = ind.get("rsi", 50)
-    
-    if position_type == "LONG":
-        # LONG: Low RSI is ideal, but allow values up to 80 for strong trends
-        if rsi < CONFIG["rsi_oversold"]:
-            confidence += 20  # Oversold - ideal entry
-        elif rsi < 50:
-            # RSI below 50 is good for LONG
-            confidence += 20 * (50 - rsi) / 50
-        else:
-            # Allow some trending setups (RSI 50-80)
-            confidence += max(0, 10 * (80 - rsi) / 30)
-    else:
-        # SHORT: High RSI is ideal, but allow down to 20 for strong trends
-        if rsi > CONFIG["rsi_overbought"]:
-            confidence += 20  # Overbought - ideal entry
-        elif rsi > 50:
-            # RSI above 50 is good for SHORT
-            confidence += 20 * (rsi - 50) / 50
-        else:
-            # Allow some trending setups (RSI 20-50)
-            confidence += max(0, 10 * (rsi - 20) / 30)
-    
+
+    # Scoring is written for LONG; SHORT mirrors it by flipping the sign of
+    # every difference (and RSI around 50). Conditions become 0/1 multipliers.
+    sign = 1.0 if position_type == "LONG" else -1.0
+
+    # 1. EMA Crossover & Trend (30% weight, +5 fresh crossover bonus)
+    trend = sign * (ind.ema_fast - ind.ema_slow) > 0
+    if not trend:
+        # Fast EMA on the wrong side: the remaining 70% can't reach the
+        # confidence threshold, and evaluate() never signals here anyway
+        return 0.0
+    fresh = (bool(ind.ema_fast_prev and ind.ema_slow_prev) and
+             sign * (ind.ema_fast_prev - ind.ema_slow_prev) <= 0)
+    confidence = 30.0 + 5.0 * fresh
+
+    # 2. MACD Confirmation (25% weight; half if histogram doesn't agree)
+    macd_above = sign * (ind.macd - ind.macd_signal) > 0
+    hist_agrees = sign * ind.macd_histogram > 0
+    confidence += macd_above * (12.5 + 12.5 * hist_agrees)
+
+    # 3. RSI Alignment (20% weight) - Relaxed thresholds, allows trending setups
+    rsi = ind.rsi if sign > 0 else 100 - ind.rsi
+    extreme = RSI_OVERSOLD if sign > 0 else 100 - RSI_OVERBOUGHT
+    confidence += (20.0 if rsi < extreme else
+                   20 * (50 - rsi) / 50 if rsi < 50 else
+                   max(0, 10 * (80 - rsi) / 30))
+
     # 4. Volume Confirmation (15% weight)
-    volume_ratio = ind.get("volume_ratio", 0)
-    min_vol = CONFIG["min_volume_ratio"]
-    
-    if volume_ratio >= 1.0:
-        confidence += 15  # Above average volume
-    elif volume_ratio >= min_vol:
-        confidence += 15 * (volume_ratio / min_vol)
-    
+    volume_ratio = ind.volume_ratio
+    min_vol = MIN_VOLUME_RATIO
+    # Divide only inside the partial band; min_volume_ratio may be configured 0
+    confidence += (15.0 if volume_ratio >= 1.0 else
+                   15 * (volume_ratio / min_vol) if 0 < min_vol <= volume_ratio else
+                   0.0)
+
     # 5. Trend Strength - EMA Separation (10% weight)
-    if ema_separation > 0 and ind["last_close"]:
-        last_close = ind["last_close"]
+    ema_separation = abs(ind.ema_slow - ind.ema_fast)
+    if ema_separation > 0 and ind.last_close:
         # Normalize: 2% of price = strong separation
-        trend_strength = min(1.0, ema_separation / (last_close * 0.02))
+        trend_strength = min(1.0, ema_separation / (ind.last_close * 0.02))
         confidence += 10 * trend_strength
     
     return min(100.0, round(confidence, 1))
@@ -345,9 +759,9 @@ def calculate_position_size(entry_price: float, atr: float, rsi: float, position
     Returns:
         Position size in base currency (BTC)
     """
-    base_size = CONFIG["quantity"]
+    base_size = QUANTITY
     
-    if not CONFIG["volatility_adjusted"]:
+    if not VOLATILITY_ADJUSTED:
         return base_size
     
     # Volatility adjustment: ATR as % of price
@@ -380,10 +794,10 @@ def calculate_position_size(entry_price: float, atr: float, rsi: float, position
     position_size = base_size * vol_multiplier * rsi_multiplier
     
     # Clamp to min/max
-    position_size = max(CONFIG["min_position_size"], 
-                       min(CONFIG["max_position_size"], position_size))
+    position_size = max(MIN_POSITION_SIZE, 
+                       min(MAX_POSITION_SIZE, position_size))
     
-    return round(position_size, 6)
+    return position_size
 
 
 def calculate_trailing_stop(entry_price: float, atr: float, position_type: str) -> float:
@@ -398,14 +812,14 @@ def calculate_trailing_stop(entry_price: float, atr: float, position_type: str)
     Returns:
         Trailing stop price
     """
-    multiplier = CONFIG["atr_multiplier"]
+    multiplier = ATR_MULTIPLIER
     
     if position_type == "LONG":
         # For LONG: stop below entry
-        trailing_stop = round(entry_price - (atr * multiplier), 4)
+        trailing_stop = entry_price - (atr * multiplier)
     else:
         # For SHORT: stop above entry
-        trailing_stop = round(entry_price + (atr * multiplier), 4)
+        trailing_stop = entry_price + (atr * multiplier)
     
     return trailing_stop
 
@@ -413,7 +827,8 @@ def calculate_trailing_stop(entry_price: float, atr: float, position_type: str)
 # ─────────────────────────────────────────────
 #  SIGNAL LOGIC — edit this function
 # ─────────────────────────────────────────────
-def evaluate(candles: list[dict], return_confidence: bool = True) -> str | None | dict:
+def evaluate(candles: list[dict], return_confidence: bool = True,
+             state: StrategyState | None = None) -> str | None | dict:
     """
     Main entry point called by the bot on every new candle.
 
@@ -435,91 +850,110 @@ def evaluate(candles: list[dict], return_confidence: bool = True) -> str | None
         candles: List of candle dicts with OHLCV data
         return_confidence: If True, returns full dict with ATR and trailing stop.
                           If False, returns just signal string (backward compatible)
+        state: Optional per-pair StrategyState; indicators are then updated
+               incrementally instead of recomputed from all candles
 
     Returns:
         dict: {"signal": str, "confidence": float, "auto_execute": bool, 
                "atr": float, "position_size": float, "trailing_stop": float}
         or str: "BUY"/"SELL"/None (if return_confidence=False)
     """
-    min_candles = max(CONFIG["ema_slow"], CONFIG["macd_slow"]) + 5
-    if len(candles) < min_candles:
-        if return_confidence:
-            return {
-                "signal": None, 
-                "confidence": 0.0, 
-                "auto_execute": False,
-                "atr": 0.0,
-                "position_size": 0.0,
-                "trailing_stop": 0.0
-            }
-        return None
+    if len(candles) < MIN_CANDLES:
+        return _no_signal(return_confidence)
 
-    ind = compute_indicators(candles)
+    ind = state.update(candles) if state is not None else compute_indicators(candles)
+    return evaluate_from_ind(ind, len(candles), return_confidence)
 
-    if None in (ind["ema_fast"], ind["ema_slow"],
-                ind["ema_fast_prev"], ind["ema_slow_prev"]):
-        if return_confidence:
-            return {
-                "signal": None, 
-                "confidence": 0.0, 
-                "auto_execute": False,
-                "atr": 0.0,
-                "position_size": 0.0,
-                "trailing_stop": 0.0
-            }
-        return None
 
-    # EMA crossover detection
-    crossed_up   = (ind["ema_fast_prev"] <= ind["ema_slow_prev"] and
-                    ind["ema_fast"]       >  ind["ema_slow"])
+def _no_signal(return_confidence: bool) -> dict | None:
+    if return_confidence:
+        return {
+            "signal": None, 
+            "confidence": 0.0, 
+            "auto_execute": False,
+            "atr": 0.0,
+            "position_size": 0.0,
+            "trailing_stop": 0.0
+        }
+    return None
+
+
+def _ema_crossover(ind: Indicators) -> tuple[bool, bool]:
+    """(crossed_up, crossed_down) for the fast/slow EMA on the latest candle."""
+    crossed_up   = (ind.ema_fast_prev <= ind.ema_slow_prev and
+                    ind.ema_fast       >  ind.ema_slow)
+
+    crossed_down = (ind.ema_fast_prev >= ind.ema_slow_prev and
+                    ind.ema_fast       <  ind.ema_slow)
+    return crossed_up, crossed_down
+
+
+def evaluate_from_ind(ind: Indicators | None, candle_count: int,
+                      return_confidence: bool = True) -> str | None | dict:
+    """
+    Signal logic of evaluate() on already-computed indicators.
+
+    Lets callers that also need the indicators (e.g. calculate_signal_strength)
+    compute them once. Same return shape as evaluate().
+    """
+    if candle_count < MIN_CANDLES:
+        return _no_signal(return_confidence)
 
-    crossed_down = (ind["ema_fast_prev"] >= ind["ema_slow_prev"] and
-                    ind["ema_fast"]       <  ind["ema_slow"])
+    if ind is None or None in (ind.ema_fast, ind.ema_slow,
+                               ind.ema_fast_prev, ind.ema_slow_prev):
+        return _no_signal(return_confidence)
+
+    # EMA crossover detection
+    crossed_up, crossed_down = _ema_crossover(ind)
     
     # MACD crossover detection
-    macd_crossed_up = (ind["macd"] > ind["macd_signal"])
-    macd_crossed_down = (ind["macd"] < ind["macd_signal"])
+    macd_crossed_up = (ind.macd > ind.macd_signal)
+    macd_crossed_down = (ind.macd < ind.macd_signal)
     
     # Volume check
-    volume_confirmed = ind.get("volume_ratio", 0) >= CONFIG["min_volume_ratio"]
+    volume_confirmed = ind.volume_ratio >= MIN_VOLUME_RATIO
 
     signal = None
     confidence = 0.0
     auto_execute = False
-    atr = ind.get("atr", 0.0)
+    atr = ind.atr
     position_size = 0.0
     trailing_stop = 0.0
     
-    current_price = ind["last_close"]
+    current_price = ind.last_close
 
     # LONG Signal: EMA crossup + MACD confirmation + Volume check
     if crossed_up and macd_crossed_up and volume_confirmed:
         signal = "LONG"
         confidence = calculate_confidence(ind, "LONG")
-        position_size = calculate_position_size(current_price, atr, ind["rsi"], "LONG")
+        position_size = calculate_position_size(current_price, atr, ind.rsi, "LONG")
         trailing_stop = calculate_trailing_stop(current_price, atr, "LONG")
-        auto_execute = CONFIG["auto_execute"] and confidence >= CONFIG["confidence_threshold"]
+        auto_execute = AUTO_EXECUTE and confidence >= CONFIDENCE_THRESHOLD
+        # %-style args: formatting is skipped entirely when INFO is disabled
         logger.info(
-            f"LONG signal | EMA: {ind['ema_fast']:.2f}>{ind['ema_slow']:.2f} | "
-            f"MACD: {ind['macd']:.4f}>{ind['macd_signal']:.4f} | RSI: {ind['rsi']} | "
-            f"Volume: {ind['volume_ratio']:.2f}x | ATR: {atr:.4f} | "
-            f"Confidence: {confidence:.1f}% | Position Size: {position_size:.6f} BTC | "
-            f"Trailing Stop: {trailing_stop:.2f} | Auto-execute: {auto_execute}"
+            "LONG signal | EMA: %.2f>%.2f | MACD: %.4f>%.4f | RSI: %.2f | "
+            "Volume: %.2fx | ATR: %.4f | Confidence: %.1f%% | Position Size: %.6f BTC | "
+            "Trailing Stop: %.2f | Auto-execute: %s",
+            ind.ema_fast, ind.ema_slow, ind.macd, ind.macd_signal, ind.rsi,
+            ind.volume_ratio, atr, confidence, position_size,
+            trailing_stop, auto_execute,
         )
 
     # SHORT Signal: EMA crossdown + MACD confirmation + Volume check
     elif crossed_down and macd_crossed_down and volume_confirmed:
         signal = "SHORT"
         confidence = calculate_confidence(ind, "SHORT")
-        position_size = calculate_position_size(current_price, atr, ind["rsi"], "SHORT")
+        position_size = calculate_position_size(current_price, atr, ind.rsi, "SHORT")
         trailing_stop = calculate_trailing_stop(current_price, atr, "SHORT")
-        auto_execute = CONFIG["auto_execute"] and confidence >= CONFIG["confidence_threshold"]
+        auto_execute = AUTO_EXECUTE and confidence >= CONFIDENCE_THRESHOLD
+        # %-style args: formatting is skipped entirely when INFO is disabled
         logger.info(
-            f"SHORT signal | EMA: {ind['ema_fast']:.2f}<{ind['ema_slow']:.2f} | "
-            f"MACD: {ind['macd']:.4f}<{ind['macd_signal']:.4f} | RSI: {ind['rsi']} | "
-            f"Volume: {ind['volume_ratio']:.2f}x | ATR: {atr:.4f} | "
-            f"Confidence: {confidence:.1f}% | Position Size: {position_size:.6f} BTC | "
-            f"Trailing Stop: {trailing_stop:.2f} | Auto-execute: {auto_execute}"
+            "SHORT signal | EMA: %.2f<%.2f | MACD: %.4f<%.4f | RSI: %.2f | "
+            "Volume: %.2fx | ATR: %.4f | Confidence: %.1f%% | Position Size: %.6f BTC | "
+            "Trailing Stop: %.2f | Auto-execute: %s",
+            ind.ema_fast, ind.ema_slow, ind.macd, ind.macd_signal, ind.rsi,
+            ind.volume_ratio, atr, confidence, position_size,
+            trailing_stop, auto_execute,
         )
 
     if return_confidence:
@@ -534,6 +968,109 @@ def evaluate(candles: list[dict], return_confidence: bool = True) -> str | None
     return signal
 
 
+# ─────────────────────────────────────────────
+#  Batch backtesting (vectorized)
+# ─────────────────────────────────────────────
+def _ema_vec(closes: np.ndarray, period: int) -> np.ndarray:
+    """
+    EMA over the full series, aligned with closes.
+    Bars before the seed (first period-1) are NaN.
+    """
+    out = np.full(len(closes), np.nan)
+    if len(closes) < period:
+        return out
+    k, one_minus_k = _ema_k(period)
+    seed = math.fsum(closes[:period]) / period
+    out[period - 1] = seed
+    if lfilter is not None:
+        out[period:], _ = lfilter([k], [1.0, -one_minus_k], closes[period:], zi=[one_minus_k * seed])
+    else:
+        prev = seed
+        for i in range(period, len(closes)):
+            prev = closes[i] * k + prev * one_minus_k
+            out[i] = prev
+    return out
+
+
+def _rsi_vec(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI for every bar, using the same SMA-of-deltas window as _rsi().
+    Bars without a full window are NaN.
+    """
+    out = np.full(len(closes), np.nan)
+    if len(closes) < period + 1:
+        return out
+    deltas = np.diff(closes)
+    windows = np.lib.stride_tricks.sliding_window_view(deltas, period)
+    avg_gain = np.clip(windows, 0, None).sum(axis=1) / period
+    avg_loss = np.clip(-windows, 0, None).sum(axis=1) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    out[period:] = rsi
+    return out
+
+
+def evaluate_batch(closes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized EMA-crossover signals for every bar at once (backtests / parameter search).
+
+    BUY  (+1) when fast EMA crosses above slow EMA and RSI < rsi_overbought
+    SELL (-1) when fast EMA crosses below slow EMA and RSI > rsi_oversold
+
+    MACD/volume confirmation is not applied here — this is the cheap screening
+    pass; replay candidate bars through evaluate() for the full signal.
+
+    Args:
+        closes: 1-D array of close prices (oldest first)
+
+    Returns:
+        int8 array of len(closes): +1 / -1 / 0 per bar (bar 0 is always 0)
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    signals = np.zeros(len(closes), dtype=np.int8)
+    if len(closes) < EMA_SLOW + 1:
+        return signals
+
+    ef = _ema_vec(closes, EMA_FAST)
+    es = _ema_vec(closes, EMA_SLOW)
+    rsi = _rsi_vec(closes, RSI_PERIOD)[1:]
+
+    crossed_up   = (ef[:-1] <= es[:-1]) & (ef[1:] > es[1:])
+    crossed_down = (ef[:-1] >= es[:-1]) & (ef[1:] < es[1:])
+
+    buy  = crossed_up & (rsi < RSI_OVERBOUGHT)
+    sell = crossed_down & (rsi > RSI_OVERSOLD)
+
+    signals[1:] = np.where(buy, 1, np.where(sell, -1, 0))
+    return signals
+
+
+def atr_batch(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Latest ATR for many pairs at once (same definition as _atr).
+
+    Args:
+        highs, lows, closes: (n_pairs, n_candles) arrays, oldest candle first
+
+    Returns:
+        (n_pairs,) array of ATR values (0.0 for every pair if n_candles < period)
+    """
+    if closes.shape[1] < period:
+        return np.zeros(closes.shape[0])
+    prev_close = np.empty_like(closes)
+    prev_close[:, 0] = closes[:, 0]
+    prev_close[:, 1:] = closes[:, :-1]
+    tr = np.maximum.reduce([highs - lows, np.abs(highs - prev_close), np.abs(lows - prev_close)])
+    return tr[:, -period:].sum(axis=1) / period
+
+
+def volume_ma_batch(volumes: np.ndarray, period: int = 20) -> np.ndarray:
+    """Latest volume SMA per pair for an (n_pairs, n_candles) volume array."""
+    if volumes.shape[1] < period:
+        return np.zeros(volumes.shape[0])
+    return volumes[:, -period:].sum(axis=1) / period
+
+
 # ─────────────────────────────────────────────
 #  TP / SL price calculation
 # ─────────────────────────────────────────────
@@ -547,8 +1084,8 @@ def calculate_tp_sl(entry_price: float, position_type: str, atr: float = 0.0) ->
         position_type: "LONG" or "SHORT"
         atr: ATR value (optional for dynamic stops)
     """
-    tp_pct = CONFIG["tp_pct"]
-    sl_pct = CONFIG["sl_pct"]
+    tp_pct = TP_PCT
+    sl_pct = SL_PCT
     
     if position_type == "LONG":
         tp = round(entry_price * (1 + tp_pct), 4)
@@ -612,28 +1149,31 @@ def calculate_signal_strength(candles: list[dict]) -> float:
           * RSI levels
           * Volume
     """
-    min_candles = max(CONFIG["ema_slow"], CONFIG["macd_slow"]) + 5
-    if len(candles) < min_candles:
+    if len(candles) < MIN_CANDLES:
         return 0.0
     
-    # First check if there's an active signal
-    result = evaluate(candles, return_confidence=True)
-    if result and result["signal"] and result["confidence"] >= 90:
-        return 100.0  # Active signal with high confidence
-    elif result and result["signal"]:
-        return result["confidence"]  # Active signal with lower confidence
-    
-    # No signal yet - calculate proximity
+    # Indicators are computed once and shared by the signal check and proximity math
     ind = compute_indicators(candles)
-    
-    if None in (ind["ema_fast"], ind["ema_slow"]):
+
+    if ind is None or None in (ind.ema_fast, ind.ema_slow):
         return 0.0
+
+    # First check if there's an active signal — only a fresh EMA crossover can
+    # produce one, so most pairs skip the signal path and go straight to proximity
+    if ind.ema_fast_prev is not None and ind.ema_slow_prev is not None and any(_ema_crossover(ind)):
+        result = evaluate_from_ind(ind, len(candles), return_confidence=True)
+        if result and result["signal"] and result["confidence"] >= 90:
+            return 100.0  # Active signal with high confidence
+        elif result and result["signal"]:
+            return result["confidence"]  # Active signal with lower confidence
+    
+    # No signal yet - calculate proximity
     
     strength = 0.0
     
     # 1. EMA Proximity (40% weight) - how close to crossover
-    ema_diff = abs(ind["ema_fast"] - ind["ema_slow"])
-    last_close = ind["last_close"] if ind["last_close"] else 1
+    ema_diff = abs(ind.ema_fast - ind.ema_slow)
+    last_close = ind.last_close if ind.last_close else 1
     ema_diff_pct = (ema_diff / last_close) * 100
     
     # Closer EMAs = higher strength
@@ -645,8 +1185,8 @@ def calculate_signal_strength(candles: list[dict]) -> float:
         strength += 20 * (1 - (ema_diff_pct / 1.0))
     
     # 2. MACD Proximity (25% weight) - how close to crossover
-    macd = ind.get("macd", 0)
-    macd_signal = ind.get("macd_signal", 0)
+    macd = ind.macd
+    macd_signal = ind.macd_signal
     macd_diff = abs(macd - macd_signal)
     
     if macd_diff < 0.01:  # Very close
@@ -657,7 +1197,7 @@ def calculate_signal_strength(candles: list[dict]) -> float:
         strength += 12.5 * (1 - (macd_diff / 0.1))
     
     # 3. RSI Levels (20% weight) - extreme levels indicate potential reversal
-    rsi = ind.get("rsi", 50)
+    rsi = ind.rsi
     
     if rsi < 30 or rsi > 70:  # Extreme levels
         strength += 20
@@ -665,7 +1205,7 @@ def calculate_signal_strength(candles: list[dict]) -> float:
         strength += 10
     
     # 4. Volume (15% weight) - higher volume = more likely to move
-    volume_ratio = ind.get("volume_ratio", 0)
+    volume_ratio = ind.volume_ratio
     
     if volume_ratio >= 1.2:  # High volume
         strength += 15
@@ -673,3 +1213,17 @@ def calculate_signal_strength(candles: list[dict]) -> float:
         strength += 15 * (volume_ratio / 1.2)
     
     return min(100.0, round(strength, 1))
+
+
+def calculate_signal_strengths(candle_sets: list[list[dict]], max_workers: int | None = None) -> list[float]:
+    """
+    calculate_signal_strength() for many pairs at once, in input order.
+
+    Pairs are scored on a thread pool: the JIT kernels are nogil and the
+    NumPy paths release the GIL, so independent pairs overlap on cores.
+    """
+    if len(candle_sets) < 2:
+        return [calculate_signal_strength(candles) for candles in candle_sets]
+    workers = max_workers or min(len(candle_sets), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(calculate_signal_strength, candle_sets))
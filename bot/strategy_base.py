@@ -12,7 +12,6 @@ All strategies must inherit from this class and implement:
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +25,13 @@ class TradingStrategy(ABC):
     - CONFIG: Strategy configuration parameters
     - get_name(): Human-readable strategy name
     - get_description(): Strategy description
+
+    CONFIG is a class attribute, so strategies carry no per-instance state;
+    subclasses should declare ``__slots__ = ()`` to keep instances dict-free.
     """
 
+    __slots__ = ()
+
     # Default configuration - strategies can override
     CONFIG = {
         "pair":          "B-BTC_USDT",
@@ -53,7 +57,7 @@ class TradingStrategy(ABC):
         pass
 
     @abstractmethod
-    def evaluate(self, candles: List[Dict], return_confidence: bool = True) -> Union[str, None, Dict]:
+    def evaluate(self, candles: list[dict], return_confidence: bool = True) -> str | None | dict:
         """
         Evaluate candles and return trading signal.
 
@@ -82,11 +86,11 @@ class TradingStrategy(ABC):
         """
         pass
 
-    def get_config(self) -> Dict:
+    def get_config(self) -> dict:
         """Return strategy configuration."""
         return self.CONFIG
 
-    def update_config(self, new_config: Dict) -> None:
+    def update_config(self, new_config: dict) -> None:
         """Update strategy configuration."""
         self.CONFIG.update(new_config)
         logger.info(f"Updated config for {self.get_name()}: {new_config}")
@@ -5,14 +5,19 @@ Manages loading, switching, and execution of multiple trading strategies.
 """
 
 import importlib
-import importlib.util
+import inspect
 import os
+import sys
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Type
 from strategy_base import TradingStrategy
 
 logger = logging.getLogger(__name__)
 
+_BOT_DIR = os.path.dirname(__file__)
+
 
 class StrategyManager:
     """
@@ -21,68 +26,134 @@ class StrategyManager:
 
     def __init__(self, strategies_dir: str = "strategies"):
         self.strategies_dir = strategies_dir
+        self._strategies_path = os.path.join(_BOT_DIR, strategies_dir)
         self.strategies: Dict[str, Type[TradingStrategy]] = {}
         self.active_strategy: Optional[TradingStrategy] = None
         self.active_strategy_name: Optional[str] = None
+        self._info_cache: Dict[str, Dict] = {}
+        # Snapshot of _info_cache values, rebuilt after each load
+        self._available_info: tuple = ()
+        # Instances built during discovery; strategies keep no per-instance
+        # state, so activation reuses them instead of constructing again.
+        self._prototypes: Dict[str, TradingStrategy] = {}
+        # mtime of each strategy file when its module was last executed
+        self._module_mtimes: Dict[str, float] = {}
+        # Bound methods of the active strategy (None until one is set)
+        self._evaluate = None
+        self._calc_tp_sl = None
+        self._update_cfg = None
+        self._config_cache: Optional[Dict] = None
+        # Last evaluate() failure, so a strategy failing every tick logs once
+        self._evaluate_error: Optional[str] = None
+
+        # Strategies are discovered on first use, not at construction.
+        # The lock makes concurrent first requests wait for discovery instead
+        # of seeing an empty registry.
+        self._loaded = False
+        self._load_lock = threading.Lock()
 
-        # Auto-discover and load strategies
-        self._load_strategies()
+    def _ensure_loaded(self) -> None:
+        """Run strategy discovery once, on first use."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load_strategies()
+                # Only after success: a failed discovery is retried next use
+                self._loaded = True
 
     def _load_strategies(self) -> None:
         """Auto-discover and load all strategy classes from strategies/ directory."""
-        strategies_path = os.path.join(os.path.dirname(__file__), self.strategies_dir)
+        strategies_path = self._strategies_path
 
         if not os.path.exists(strategies_path):
-            logger.warning(f"Strategies directory not found: {strategies_path}")
+            logger.warning("Strategies directory not found: %s", strategies_path)
             return
 
-        logger.info(f"Loading strategies from: {strategies_path}")
+        logger.debug("Loading strategies from: %s", strategies_path)
+
+        _TradingStrategy = TradingStrategy
+        prefix = self.strategies_dir + "."
 
         # Import all .py files in strategies directory
-        for filename in os.listdir(strategies_path):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                module_name = filename[:-3]  # Remove .py extension
-                try:
-                    # Import using the full path to ensure proper module location
-                    spec = importlib.util.spec_from_file_location(
-                        f"strategies.{module_name}",
-                        os.path.join(strategies_path, filename)
-                    )
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(module)
-                        
-                        # Find strategy classes in the module
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            if (isinstance(attr, type) and
-                                issubclass(attr, TradingStrategy) and
-                                attr != TradingStrategy):
-                                strategy_name = attr().get_name().lower().replace(' ', '_')
-                                self.strategies[strategy_name] = attr
-                                logger.info(f"Loaded strategy: {strategy_name} ({attr.__name__})")
-
-                except Exception as e:
-                    logger.error(f"Failed to load strategy {module_name}: {e}")
-
-        logger.info(f"Loaded {len(self.strategies)} strategies: {list(self.strategies.keys())}")
+        entries = []
+        with os.scandir(strategies_path) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith('.py') or name.startswith('__'):
+                    continue
+                if entry.is_file():
+                    entries.append(entry)
 
-    def get_available_strategies(self) -> List[Dict]:
-        """Get list of all available strategies with metadata."""
-        strategies_info = []
-        for name, strategy_class in self.strategies.items():
+        # Import in parallel: per-module import locks let file I/O and
+        # compilation of different strategy files overlap
+        if len(entries) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(entries))) as ex:
+                results = list(ex.map(lambda e: self._load_module(e, prefix), entries))
+        else:
+            results = [self._load_module(e, prefix) for e in entries]
+
+        loaded = {}
+        for result in results:
+            if result is not None:
+                key, module, mtime = result
+                self._module_mtimes[key] = mtime
+                loaded[key] = module
+
+        # Find strategy classes through the subclass registry rather than
+        # scanning every module attribute. Only classes still bound in one of
+        # the loaded modules count (a re-executed file leaves stale classes
+        # behind until they are collected).
+        classes = _TradingStrategy.__subclasses__()
+        for attr in classes:
+            classes.extend(attr.__subclasses__())
+            module = loaded.get(attr.__module__)
+            if module is None or getattr(module, attr.__name__, None) is not attr:
+                continue
+            if inspect.isabstract(attr):
+                continue  # intermediate base class, not a strategy
             try:
-                instance = strategy_class()
-                strategies_info.append({
-                    "name": name,
+                instance = attr()
+                strategy_name = instance.get_name().lower().replace(' ', '_')
+                self.strategies[strategy_name] = attr
+                self._prototypes[strategy_name] = instance
+                self._info_cache[strategy_name] = {
+                    "name": strategy_name,
                     "display_name": instance.get_name(),
                     "description": instance.get_description(),
                     "config": instance.get_config()
-                })
+                }
+                logger.debug("Loaded strategy: %s (%s)", strategy_name, attr.__name__)
             except Exception as e:
-                logger.error(f"Error getting info for strategy {name}: {e}")
+                logger.error("Failed to load strategy %s.%s: %s", attr.__module__, attr.__name__, e)
+
+        self._available_info = tuple(self._info_cache.values())
+        logger.info("Loaded %s strategies: %s", len(self.strategies), list(self.strategies.keys()))
+
+    def _load_module(self, entry: os.DirEntry, prefix: str) -> Optional[tuple]:
+        """Import (or re-import if modified) one strategy file -> (key, module, mtime)."""
+        module_name = entry.name[:-3]  # Remove .py extension
+        try:
+            key = prefix + module_name
+            mtime = entry.stat().st_mtime
+            module = sys.modules.get(key)
 
-        return strategies_info
+            # Regular package import (sys.modules cache + import lock);
+            # re-execute only files modified since they were loaded
+            if module is None:
+                module = importlib.import_module(key)
+            elif self._module_mtimes.get(key, mtime) != mtime:
+                module = importlib.reload(module)
+            return key, module, mtime
+
+        except Exception as e:
+            logger.error("Failed to load strategy %s: %s", module_name, e)
+            return None
+
+    def get_available_strategies(self) -> List[Dict]:
+        """Get list of all available strategies with metadata (built once at load)."""
+        self._ensure_loaded()
+        return list(self._available_info)
 
     def set_active_strategy(self, strategy_name: str) -> bool:
         """
@@ -94,17 +165,29 @@ class StrategyManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        self._ensure_loaded()
         if strategy_name not in self.strategies:
-            logger.error(f"Strategy not found: {strategy_name}")
+            logger.error("Strategy not found: %s", strategy_name)
             return False
 
         try:
-            self.active_strategy = self.strategies[strategy_name]()
+            # Reuse the instance across toggles; build (and keep) one only if
+            # discovery didn't leave a prototype behind
+            instance = self._prototypes.get(strategy_name)
+            if instance is None:
+                instance = self.strategies[strategy_name]()
+                self._prototypes[strategy_name] = instance
+            self.active_strategy = instance
             self.active_strategy_name = strategy_name
-            logger.info(f"Activated strategy: {strategy_name} ({self.active_strategy.get_name()})")
+            self._evaluate = instance.evaluate
+            self._calc_tp_sl = instance.calculate_tp_sl
+            self._update_cfg = instance.update_config
+            self._config_cache = instance.get_config()
+            self._evaluate_error = None
+            logger.info("Activated strategy: %s (%s)", strategy_name, self.active_strategy.get_name())
             return True
         except Exception as e:
-            logger.error(f"Failed to activate strategy {strategy_name}: {e}")
+            logger.error("Failed to activate strategy %s: %s", strategy_name, e)
             return False
 
     def get_active_strategy(self) -> Optional[TradingStrategy]:
@@ -117,53 +200,71 @@ class StrategyManager:
 
     def evaluate(self, candles: List[Dict], return_confidence: bool = True) -> Optional[Dict]:
         """Evaluate candles using the active strategy."""
-        if not self.active_strategy:
+        evaluate = self._evaluate
+        if evaluate is None:
             logger.warning("No active strategy set")
             return None
 
         try:
-            return self.active_strategy.evaluate(candles, return_confidence)
+            result = evaluate(candles, return_confidence)
         except Exception as e:
-            logger.error(f"Strategy evaluation failed: {e}")
+            error = repr(e)
+            if error != self._evaluate_error:
+                self._evaluate_error = error
+                logger.error("Strategy evaluation failed: %s", e)
             return None
+        self._evaluate_error = None
+        return result
 
     def calculate_tp_sl(self, entry_price: float, position_type: str, **kwargs) -> tuple[float, float]:
         """Calculate TP/SL using the active strategy."""
-        if not self.active_strategy:
+        calc_tp_sl = self._calc_tp_sl
+        if calc_tp_sl is None:
             logger.warning("No active strategy set")
             return (0.0, 0.0)
 
         try:
-            return self.active_strategy.calculate_tp_sl(entry_price, position_type, **kwargs)
+            return calc_tp_sl(entry_price, position_type, **kwargs)
         except Exception as e:
-            logger.error(f"TP/SL calculation failed: {e}")
+            logger.error("TP/SL calculation failed: %s", e)
             return (0.0, 0.0)
 
     def get_config(self) -> Optional[Dict]:
         """Get active strategy configuration."""
-        if not self.active_strategy:
-            return None
-        return self.active_strategy.get_config()
+        return self._config_cache
 
     def update_config(self, new_config: Dict) -> bool:
         """Update active strategy configuration."""
-        if not self.active_strategy:
+        update_cfg = self._update_cfg
+        if update_cfg is None:
             logger.warning("No active strategy set")
             return False
 
         try:
-            self.active_strategy.update_config(new_config)
+            update_cfg(new_config)
+            self._config_cache = self.active_strategy.get_config()
             return True
         except Exception as e:
-            logger.error(f"Config update failed: {e}")
+            logger.error("Config update failed: %s", e)
             return False
 
     def reload_strategies(self) -> None:
         """Reload all strategies from disk."""
-        self.strategies.clear()
-        self._load_strategies()
+        with self._load_lock:
+            self._loaded = False
+            self.strategies.clear()
+            self._info_cache.clear()
+            self._prototypes.clear()
+            self._load_strategies()
+            self._loaded = True
         logger.info("Reloaded all strategies")
 
 
-# Global strategy manager instance
-strategy_manager = StrategyManager()
\ No newline at end of file
+# Global strategy manager instance (cheap to build: discovery runs on first use)
+strategy_manager = StrategyManager()
+
+
+def get_strategy_manager() -> StrategyManager:
+    """Return the shared StrategyManager, loading strategies if needed."""
+    strategy_manager._ensure_loaded()
+    return strategy_manager
\ No newline at end of file
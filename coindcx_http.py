@@ -0,0 +1,65 @@
+"""
+Shared HTTP session for the standalone CoinDCX probe scripts
+(test_balance.py, test_balance_v2.py, test_wallet_official.py,
+test_coindcx_positions.py).
+
+All of them talk to api.coindcx.com, so they share one keep-alive session:
+after the first request, later ones skip the TCP + TLS handshake. Transient
+connection errors are retried briefly by the adapter.
+
+The JSON helpers use orjson when it is installed and fall back to the
+standard library otherwise, so the scripts keep working without it.
+"""
+
+import json
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Full response dumps are only printed when COINDCX_VERBOSE is set; for a
+# wallet list, formatting them costs more than the request itself
+VERBOSE = bool(os.environ.get("COINDCX_VERBOSE"))
+
+_SESSION = None
+
+
+def get_session():
+    """Return the process-wide requests.Session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        ))
+        _SESSION = session
+    return _SESSION
+
+
+def encode_body(body):
+    """Compact JSON bytes for a request body: sign these and send them as-is."""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, separators=(',', ':')).encode('utf-8')
+
+
+def decode_response(response):
+    """Parse a response body as JSON; raises ValueError if it isn't JSON."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def pretty(data):
+    """Indented JSON text for printing."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
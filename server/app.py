@@ -1,11 +1,23 @@
 import sys
 import os
 import json
+import hashlib
+import hmac
+import subprocess
+import threading
+import time
 sys.path.insert(0, '/home/ubuntu/trading-bot/bot')
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
+from typing import NamedTuple
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
 import db
 
 # Try to import strategy_manager, fallback if fails
@@ -18,102 +30,204 @@ except Exception as e:
     STRATEGY_MANAGER_LOADED = False
 
 from coindcx import CoinDCXREST
+from _njit import njit, NUMBA_AVAILABLE
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pystemd.systemd1 import Unit as SystemdUnit
+except ImportError:
+    SystemdUnit = None
+
+# Keep-alive connection pool shared by every CoinDCX call the server makes,
+# sized for the concurrent per-pair fetches on _FETCH_POOL
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
+_HTTP.headers.update({"Content-Type": "application/json"})
+
+# API credentials are read from the bot's .env once at startup; POST
+# /api/admin/reload_env picks up edits without restarting the server.
+# _CLIENT is the one CoinDCXREST the server uses (public candle calls
+# ignore the keys), so its INR/USDT rate cache is shared too.
+_ENV_PATH = "/home/ubuntu/trading-bot/.env"
+_API_KEY = None
+_API_SECRET = None
+_CLIENT = None
+
+
+def _load_env(override=False):
+    global _API_KEY, _API_SECRET, _CLIENT
+    load_dotenv(_ENV_PATH, override=override)
+    _API_KEY = os.getenv("COINDCX_API_KEY")
+    _API_SECRET = os.getenv("COINDCX_API_SECRET")
+    _CLIENT = CoinDCXREST(_API_KEY or "", _API_SECRET or "", session=_HTTP)
+
+
+_load_env()
 
 # IST timezone (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
+_IST_OFFSET = np.timedelta64(330, "m")
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, so every jsonify() call uses the
+    native encoder. Output matches the default provider: sorted keys, and
+    datetimes/dates/Decimals still go through Flask's `default` hook.
+    """
+
+    _options = (
+        (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+         | orjson.OPT_PASSTHROUGH_DATETIME)
+        if orjson else 0
+    )
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self._app.debug:
+            return super().response(*args, **kwargs)  # keep pretty-printing
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options),
+            mimetype=self.mimetype,
+        )
+
 
 app = Flask(__name__)
 CORS(app)
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+# Constant bodies for the empty/fallback responses, serialized once. A fresh
+# Response is still built per request (after_request hooks such as CORS
+# mutate headers, so Response objects can't be shared).
+_EMPTY_LIST_JSON = b"[]"
+_EMPTY_STATS_JSON = json.dumps({
+    "total": 0,
+    "wins": 0,
+    "losses": 0,
+    "total_pnl": 0.0,
+    "win_rate": 0.0,
+    "avg_pnl": 0.0
+}, separators=(",", ":"), sort_keys=True).encode()
+
+
+def _empty_list_response():
+    return app.response_class(_EMPTY_LIST_JSON, mimetype="application/json")
+
+
+def _empty_stats_response():
+    return app.response_class(_EMPTY_STATS_JSON, mimetype="application/json")
 
 db.init_db()
 
 
+_NUMBER_JUNK = str.maketrans("", "", ",₹")
+_CURRENCY_UNITS = ("INR", "USDT")
+
+
 def _to_float(value):
+    # Plain numbers and clean numeric strings convert directly
     try:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            cleaned = value.strip().replace(",", "")
-            cleaned = cleaned.replace("₹", "").replace("INR", "").replace("USDT", "").strip()
-            if cleaned == "":
-                return None
-            return float(cleaned)
         return float(value)
     except (TypeError, ValueError):
+        pass
+    if not isinstance(value, str):
+        return None
+    cleaned = value.translate(_NUMBER_JUNK).strip()
+    # Units only ever appear as a suffix ("1,234.5 INR") or a prefix, so
+    # slice them off instead of scanning the whole string per unit
+    for unit in _CURRENCY_UNITS:
+        if cleaned.endswith(unit):
+            cleaned = cleaned[:-len(unit)].rstrip()
+            break
+        if cleaned.startswith(unit):
+            cleaned = cleaned[len(unit):].lstrip()
+            break
+    if cleaned == "":
+        return None
+    try:
+        return float(cleaned)
+    except ValueError:
         return None
 
 
-def _extract_balance(payload):
-    keys = (
-        "available_balance",
-        "balance",
-        "wallet_balance",
-        "total_balance",
-        "usdt_balance",
-        "margin_balance",
-    )
-
-    if isinstance(payload, dict):
-        for key in keys:
-            if key in payload:
-                numeric = _to_float(payload.get(key))
-                if numeric is not None:
-                    return numeric
-
-        if payload.get("currency") == "USDT" or payload.get("asset") == "USDT":
-            for key in keys:
-                numeric = _to_float(payload.get(key))
-                if numeric is not None:
-                    return numeric
-
-        for value in payload.values():
-            numeric = _extract_balance(value)
-            if numeric is not None:
-                return numeric
-
-    if isinstance(payload, list):
-        for item in payload:
-            numeric = _extract_balance(item)
-            if numeric is not None:
-                return numeric
-
-    return None
-
-
-def _resolve_inr_amount(pair: str, provided):
+def _resolve_inr_amount(pair: str, provided, configs=None):
+    # configs: optional {pair: row} preloaded by bulk callers
     if provided is not None:
         parsed = _to_float(provided)
         if parsed is not None:
             return parsed
-    existing = db.get_pair_config(pair)
+    existing = configs.get(pair) if configs is not None else db.get_pair_config(pair)
     if existing and existing.get("inr_amount") is not None:
         return existing.get("inr_amount")
     return 300.0
 
 
-def _extract_balance_with_currency(payload):
-    keys = (
-        "available_balance",
-        "availableBalance",
-        "balance",
-        "walletBalance",
-        "wallet_balance",
-        "currentValue",
-        "current_value",
-        "total_balance",
-        "totalBalance",
-        "margin_balance",
-        "marginBalance",
-        "usdt_balance",
-        "usdtBalance",
-        "inr_balance",
-        "inrBalance",
-    )
+_BALANCE_KEYS = (
+    "available_balance",
+    "availableBalance",
+    "balance",
+    "walletBalance",
+    "wallet_balance",
+    "currentValue",
+    "current_value",
+    "total_balance",
+    "totalBalance",
+    "margin_balance",
+    "marginBalance",
+    "usdt_balance",
+    "usdtBalance",
+    "inr_balance",
+    "inrBalance",
+)
+# Lets dicts without any known balance key skip the ordered scan below
+_BALANCE_KEY_SET = frozenset(_BALANCE_KEYS)
+
+_BALANCE_KEY_PRIORITY = {
+    "available_balance": 0,
+    "wallet_balance": 1,
+    "total_balance": 2,
+    "balance": 3,
+    "margin_balance": 4,
+    "inr_balance": 5,
+    "usdt_balance": 6,
+    "availableBalance": 0,
+    "walletBalance": 1,
+    "totalBalance": 2,
+    "marginBalance": 4,
+    "inrBalance": 5,
+    "usdtBalance": 6,
+    "currentValue": 7,
+    "current_value": 7,
+}
 
+
+def _extract_balance_with_currency(payload):
+    keys = _BALANCE_KEYS
+    key_set = _BALANCE_KEY_SET
     candidates = []
     generic_candidates = []
 
-    def walk(node, inherited_currency=None):
+    # Depth-first, in document order, with an explicit stack of
+    # (node, currency inherited from the enclosing dict)
+    stack = [(payload, None)]
+    while stack:
+        node, inherited_currency = stack.pop()
         if isinstance(node, dict):
             currency = (
                 node.get("currency_short_name")  # CoinDCX futures uses this
@@ -127,45 +241,54 @@ def _extract_balance_with_currency(payload):
             )
             currency = currency.upper() if isinstance(currency, str) else inherited_currency
 
-            for key in keys:
-                if key in node:
-                    numeric = _to_float(node.get(key))
+            # Skip dicts with no known balance key. Otherwise scan in
+            # _BALANCE_KEYS order: choose() breaks ties on candidate order,
+            # so iterating a set intersection would change results.
+            if not key_set.isdisjoint(node):
+                for key in keys:
+                    if key in node:
+                        numeric = _to_float(node.get(key))
+                        if numeric is not None:
+                            # A non-zero INR priority-0 key is what choose() would
+                            # pick anyway (INR beats USDT, first minimum wins), so
+                            # stop walking. USDT can't exit early: INR may follow.
+                            if currency == "INR" and numeric != 0 and _BALANCE_KEY_PRIORITY.get(key) == 0:
+                                return numeric, currency
+                            candidates.append((currency, key, numeric))
+
+            # Generic candidates are only used if no explicit key ever
+            # matches, so stop scanning for them once one has.
+            if not candidates:
+                for key, raw_value in node.items():
+                    # Filter on the key first; only matching keys pay for _to_float.
+                    # Chained `in` tests short-circuit and beat any()/regex here.
+                    key_l = key.lower() if isinstance(key, str) else str(key).lower()
+                    if not (
+                        "balance" in key_l
+                        or "wallet" in key_l
+                        or "equity" in key_l
+                        or "value" in key_l
+                        or "fund" in key_l
+                    ):
+                        continue
+                    if (
+                        "pnl" in key_l
+                        or "roi" in key_l
+                        or "leverage" in key_l
+                        or "rate" in key_l
+                        or "price" in key_l
+                        or "id" == key_l
+                    ):
+                        continue
+
+                    numeric = _to_float(raw_value)
                     if numeric is not None:
-                        candidates.append((currency, key, numeric))
+                        generic_candidates.append((currency, key, numeric))
 
-            for key, raw_value in node.items():
-                key_l = str(key).lower()
-                numeric = _to_float(raw_value)
-                if numeric is None:
-                    continue
-
-                include = (
-                    "balance" in key_l
-                    or "wallet" in key_l
-                    or "equity" in key_l
-                    or "value" in key_l
-                    or "fund" in key_l
-                )
-                exclude = (
-                    "pnl" in key_l
-                    or "roi" in key_l
-                    or "leverage" in key_l
-                    or "rate" in key_l
-                    or "price" in key_l
-                    or "id" == key_l
-                )
-
-                if include and not exclude:
-                    generic_candidates.append((currency, key, numeric))
-
-            for value in node.values():
-                walk(value, currency)
+            stack.extend((value, currency) for value in reversed(node.values()))
 
         elif isinstance(node, list):
-            for item in node:
-                walk(item, inherited_currency)
-
-    walk(payload)
+            stack.extend((item, inherited_currency) for item in reversed(node))
 
     if not candidates:
         candidates = generic_candidates
@@ -173,23 +296,7 @@ def _extract_balance_with_currency(payload):
     if not candidates:
         return None, None
 
-    key_priority = {
-        "available_balance": 0,
-        "wallet_balance": 1,
-        "total_balance": 2,
-        "balance": 3,
-        "margin_balance": 4,
-        "inr_balance": 5,
-        "usdt_balance": 6,
-        "availableBalance": 0,
-        "walletBalance": 1,
-        "totalBalance": 2,
-        "marginBalance": 4,
-        "inrBalance": 5,
-        "usdtBalance": 6,
-        "currentValue": 7,
-        "current_value": 7,
-    }
+    key_priority = _BALANCE_KEY_PRIORITY
 
     def choose(cands):
         non_zero = [c for c in cands if c[2] != 0]
@@ -222,32 +329,46 @@ def _is_not_found_payload(payload):
     return status == "error" and ("not_found" in message or code == "404")
 
 
-def _fetch_wallet_payload(key, secret, debug=False):
-    import requests, hmac, hashlib, time, json
+_HMAC_KEYS = {}  # API secret -> keyed HMAC-SHA256 object; copied per signature
+
+
+def _sign(secret, json_body):
+    keyed = _HMAC_KEYS.get(secret)
+    if keyed is None:
+        keyed = _HMAC_KEYS[secret] = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+    mac = keyed.copy()  # skips re-deriving the inner/outer pads
+    mac.update(json_body.encode())
+    return mac.hexdigest()
+
+
+def _resp_json(resp):
+    """Decode a CoinDCX response body; orjson parses the raw bytes when installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
 
+
+# The signed body is just a timestamp; format it rather than running the
+# JSON encoder on a one-key dict
+_WALLET_BODY = '{"timestamp":%d}'
+
+
+def _fetch_wallet_payload(key, secret, debug=False):
     # Official CoinDCX API endpoint from docs: https://docs.coindcx.com/#wallet-details
     # Returns array of wallets: [{"currency_short_name": "USDT", "balance": "123.45", ...}, ...]
     path = "/exchange/v1/derivatives/futures/wallets"
 
     try:
         # Create signature
-        body = {"timestamp": int(time.time() * 1000)}
-        sig = hmac.new(
-            secret.encode(),
-            json.dumps(body, separators=(",", ":")).encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        json_body = _WALLET_BODY % (time.time() * 1000)
+        sig = _sign(secret, json_body)
 
-        headers = {
-            "Content-Type": "application/json",
-            "X-AUTH-APIKEY": key,
-            "X-AUTH-SIGNATURE": sig,
-        }
+        # Content-Type comes from the session defaults
+        headers = {"X-AUTH-APIKEY": key, "X-AUTH-SIGNATURE": sig}
 
         # GET request as per official docs
         # IMPORTANT: Send the exact JSON string that was signed (use data= not json=)
-        json_body = json.dumps(body, separators=(",", ":"))
-        resp = requests.get(
+        resp = _HTTP.get(
             f"https://api.coindcx.com{path}",
             headers=headers,
             data=json_body,
@@ -255,7 +376,7 @@ def _fetch_wallet_payload(key, secret, debug=False):
         )
         
         if 200 <= resp.status_code < 300:
-            payload = resp.json()
+            payload = _resp_json(resp)
             if debug:
                 return {"payload": payload, "status": resp.status_code}
             return payload
@@ -270,18 +391,84 @@ def _fetch_wallet_payload(key, secret, debug=False):
         return None
 
 
-def _get_real_balance():
+# /api/status is polled every few seconds; the wallet doesn't move that fast
+_BALANCE_TTL = float(os.getenv("BAL_TTL_S", "5"))
+_BALANCE_CACHE = {"t": None, "v": (0.0, "INR")}
+_BALANCE_LOCK = threading.Lock()
+
+
+def _get_real_balance(force=False):
+    """(balance, currency), cached for _BALANCE_TTL; force=True always refetches."""
+    cached_at = _BALANCE_CACHE["t"]
+    if not force and cached_at is not None and time.monotonic() - cached_at < _BALANCE_TTL:
+        return _BALANCE_CACHE["v"]
+
+    with _BALANCE_LOCK:
+        # Another request may have refreshed it while we waited
+        cached_at = _BALANCE_CACHE["t"]
+        if not force and cached_at is not None and time.monotonic() - cached_at < _BALANCE_TTL:
+            return _BALANCE_CACHE["v"]
+        result = _fetch_real_balance()
+        _BALANCE_CACHE["v"] = result
+        _BALANCE_CACHE["t"] = time.monotonic()
+        return result
+
+
+# Bound how long /api/status can wait on CoinDCX: each wallet fetch gets one
+# overall deadline, and after repeated failures the network is skipped for a
+# cool-down period. The call itself gets a short per-attempt timeout and no
+# retries, and runs on its own single worker so a hung exchange can never
+# tie up _FETCH_POOL, which readiness and pair signals depend on.
+_WALLET_DEADLINE = 2.0
+_WALLET_FAIL_MAX = 3
+_WALLET_COOLDOWN = 30.0
+_WALLET_BREAKER = {"failures": 0, "open_until": 0.0}
+_WALLET_BREAKER_LOCK = threading.Lock()  # gthread workers update it concurrently
+_WALLET_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wallet")
+_WALLET_INFLIGHT = {"future": None}  # guarded by _WALLET_BREAKER_LOCK
+
+
+def _wallet_or_none():
+    """client.get_wallet() under the deadline/breaker; None on failure or while open."""
+    breaker = _WALLET_BREAKER
+    with _WALLET_BREAKER_LOCK:
+        if time.monotonic() < breaker["open_until"]:
+            return None
+        # Join a fetch that is still running rather than queueing another
+        future = _WALLET_INFLIGHT["future"]
+        if future is None or future.done():
+            future = _WALLET_INFLIGHT["future"] = _WALLET_POOL.submit(
+                _CLIENT.get_wallet, timeout=_WALLET_DEADLINE, max_retries=1
+            )
+    # The fetch itself runs unlocked; only the bookkeeping is serialized
+    try:
+        payload = future.result(timeout=_WALLET_DEADLINE)
+    except Exception:
+        payload = None  # timed out (the fetch finishes in the background) or raised
+    ok = bool(payload) and not (isinstance(payload, dict) and "error" in payload)
+    tripped = 0
+    with _WALLET_BREAKER_LOCK:
+        if ok:
+            breaker["failures"] = 0
+        else:
+            breaker["failures"] += 1
+            if breaker["failures"] >= _WALLET_FAIL_MAX:
+                tripped = breaker["failures"]
+                breaker["failures"] = 0
+                breaker["open_until"] = time.monotonic() + _WALLET_COOLDOWN
+    if tripped:
+        app.logger.warning(f"Wallet fetch failed {tripped} times; pausing for {_WALLET_COOLDOWN:.0f}s")
+    return payload if ok else None
+
+
+def _fetch_real_balance():
     balance = 0.0
     balance_currency = "INR"
     try:
-        from dotenv import load_dotenv
-        load_dotenv("/home/ubuntu/trading-bot/.env")
-        key = os.getenv("COINDCX_API_KEY")
-        secret = os.getenv("COINDCX_API_SECRET")
+        key, secret = _API_KEY, _API_SECRET
 
         if key and secret:
-            client = CoinDCXREST(key, secret)
-            payload = client.get_wallet()
+            payload = _wallet_or_none()
             if payload:
                 bal, curr = _extract_balance_with_currency(payload)
                 if bal is not None:
@@ -304,121 +491,176 @@ def _get_real_balance():
     return balance, balance_currency
 
 
+# Dashboards (and multiple tabs) poll the same read-only DB views every few
+# seconds; serve them from a one-second snapshot instead of re-querying SQLite
+# per request. Routes that write through the server clear it.
+_SNAPSHOT_TTL = 1.0
+_SNAPSHOTS = {}  # name -> (taken_at, value)
+
+
+def _db_snapshot(name, query, *args):
+    now = time.monotonic()
+    cached = _SNAPSHOTS.get(name)
+    if cached and now - cached[0] < _SNAPSHOT_TTL:
+        return cached[1]
+    value = query(*args)
+    _SNAPSHOTS[name] = (now, value)
+    return value
+
+
+def _tagged_snapshot(name, table, query, *args):
+    """
+    (etag, value) for a listing over an append-only table. Like _db_snapshot,
+    but once the TTL lapses only the table version is re-read; the rows are
+    re-queried only if it moved. The version is read before the rows, so a
+    tag never vouches for rows newer than it has seen.
+    """
+    now = time.monotonic()
+    cached = _SNAPSHOTS.get(name)
+    if cached and now - cached[0] < _SNAPSHOT_TTL:
+        return cached[1]
+    etag = f"{name}-{db.get_table_version(table)}"
+    if cached and cached[1][0] == etag:
+        value = cached[1]
+    else:
+        value = (etag, query(*args))
+    _SNAPSHOTS[name] = (now, value)
+    return value
+
+
+def _etag_json(etag, data):
+    """jsonify(data), or an empty 304 when the client already holds this etag."""
+    if etag in request.if_none_match:
+        resp = app.response_class(status=304)
+    else:
+        resp = jsonify(data)
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "no-cache"  # always revalidate; 304s are cheap
+    return resp
+
+
 @app.route("/api/status")
 def status():
     balance, balance_currency = _get_real_balance()
-
-    try:
-        open_trades = db.get_open_trades()
-        num_trades = len(open_trades)
-    except Exception:
-        num_trades = 0
+    bundle = _db_snapshot("status", db.get_status_bundle)
 
     return jsonify({
         "bot_running": True,
         "balance": balance,
         "balance_currency": balance_currency,
-        "open_trades": num_trades,
-        "mode": db.get_trading_mode(),
-        "paper_balance": db.get_paper_wallet_balance(),
+        "open_trades": bundle["open_trades"],
+        "mode": bundle["mode"],
+        "paper_balance": bundle["paper_balance"],
     })
 
 
 @app.route("/api/positions")
 def positions():
     try:
-        return jsonify(db.get_open_trades())
+        return jsonify(_db_snapshot("positions", db.get_open_trades))
     except Exception as e:
         app.logger.error(f"Error fetching positions: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/trades")
 def trades():
     try:
-        return jsonify(db.get_all_trades(limit=100))
+        return _etag_json(*_tagged_snapshot("trades", "trades", db.get_all_trades, 100))
     except Exception as e:
         app.logger.error(f"Error fetching trades: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/stats")
 def stats():
     try:
-        return jsonify(db.get_trade_stats())
+        return jsonify(_db_snapshot("stats", db.get_trade_stats))
     except Exception as e:
         app.logger.error(f"Error fetching stats: {e}")
-        return jsonify({
-            "total": 0,
-            "wins": 0,
-            "losses": 0,
-            "total_pnl": 0.0,
-            "win_rate": 0.0,
-            "avg_pnl": 0.0
-        })
+        return _empty_stats_response()
 
 
 @app.route("/api/paper/stats")
 def paper_stats():
     try:
-        return jsonify(db.get_paper_trade_stats())
+        return jsonify(_db_snapshot("paper_stats", db.get_paper_trade_stats))
     except Exception as e:
         app.logger.error(f"Error fetching paper stats: {e}")
-        return jsonify({
-            "total": 0,
-            "wins": 0,
-            "losses": 0,
-            "total_pnl": 0.0,
-            "win_rate": 0.0,
-            "avg_pnl": 0.0
-        })
+        return _empty_stats_response()
 
 
 @app.route("/api/equity")
 def equity():
     try:
-        return jsonify(db.get_equity_history(limit=200))
+        return _etag_json(*_tagged_snapshot("equity", "equity_snapshots", db.get_equity_history, 200))
     except Exception as e:
         app.logger.error(f"Error fetching equity: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/paper/equity")
 def paper_equity():
     try:
-        return jsonify(db.get_paper_equity_history(limit=200))
+        return _etag_json(*_tagged_snapshot(
+            "paper_equity", "paper_equity_snapshots", db.get_paper_equity_history, 200
+        ))
     except Exception as e:
         app.logger.error(f"Error fetching paper equity: {e}")
-        return jsonify([])
+        return _empty_list_response()
+
+
+def _utc_to_ist_strings(stamps):
+    """
+    Convert SQLite datetime('now') strings ('YYYY-MM-DD HH:MM:SS', UTC) to IST
+    ISO-8601 strings in one vectorized pass. Returns None if any stamp is in
+    another format so the caller can fall back to per-row parsing.
+    """
+    if any(len(s) != 19 for s in stamps):
+        return None
+    try:
+        ist = np.array(stamps, dtype="datetime64[s]") + _IST_OFFSET
+    except ValueError:
+        return None
+    return [s + "+05:30" for s in np.datetime_as_string(ist, unit="s").tolist()]
+
+
+def _recent_logs_ist():
+    logs_data = db.get_recent_logs(limit=50)
+    # Convert UTC times to IST
+    timed = [log for log in logs_data if log.get('created_at')]
+    converted = _utc_to_ist_strings([log['created_at'] for log in timed])
+    if converted is not None:
+        for log, ist_time in zip(timed, converted):
+            log['created_at'] = ist_time
+    else:
+        for log in timed:
+            try:
+                # Parse UTC time and convert to IST
+                utc_time = datetime.fromisoformat(log['created_at'].replace('Z', '+00:00'))
+                ist_time = utc_time.astimezone(IST)
+                log['created_at'] = ist_time.isoformat()
+            except Exception:
+                pass  # Keep original time if conversion fails
+    return logs_data
 
 
 @app.route("/api/logs")
 def logs():
     try:
-        logs_data = db.get_recent_logs(limit=50)
-        # Convert UTC times to IST
-        for log in logs_data:
-            if log.get('created_at'):
-                try:
-                    # Parse UTC time and convert to IST
-                    utc_time = datetime.fromisoformat(log['created_at'].replace('Z', '+00:00'))
-                    ist_time = utc_time.astimezone(IST)
-                    log['created_at'] = ist_time.isoformat()
-                except Exception:
-                    pass  # Keep original time if conversion fails
-        return jsonify(logs_data)
+        return _etag_json(*_tagged_snapshot("logs", "bot_log", _recent_logs_ist))
     except Exception as e:
         app.logger.error(f"Error fetching logs: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/paper/trades")
 def paper_trades():
     try:
-        return jsonify(db.get_all_paper_trades(limit=100))
+        return _etag_json(*_tagged_snapshot("paper_trades", "paper_trades", db.get_all_paper_trades, 100))
     except Exception as e:
         app.logger.error(f"Error fetching paper trades: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/trades/open")
@@ -427,7 +669,7 @@ def open_trades():
     try:
         trades = db.get_open_trades()
         if not trades:
-            return jsonify([])
+            return _empty_list_response()
         
         # Enhance with pair info and confidence details
         enhanced = []
@@ -448,7 +690,7 @@ def open_trades():
         return jsonify(enhanced)
     except Exception as e:
         app.logger.error(f"Error fetching open trades: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/paper/trades/open")
@@ -457,7 +699,7 @@ def open_paper_trades():
     try:
         trades = db.get_open_paper_trades()
         if not trades:
-            return jsonify([])
+            return _empty_list_response()
         
         # Enhance with pair info and confidence details
         enhanced = []
@@ -478,7 +720,7 @@ def open_paper_trades():
         return jsonify(enhanced)
     except Exception as e:
         app.logger.error(f"Error fetching open paper trades: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/mode", methods=["GET", "POST"])
@@ -496,10 +738,29 @@ def trading_mode():
         db.init_paper_wallet_if_missing(real_balance)
 
     db.set_trading_mode(mode)
+    _SNAPSHOTS.clear()
     db.log_event("INFO", f"Trading mode set to {mode}")
     return jsonify({"success": True, "mode": mode})
 
 
+# Candle interval /api/pair_signals scores on; the active strategy only
+# changes through the POST below, which refreshes it
+_ACTIVE_INTERVAL = "5m"
+
+
+def _refresh_active_interval():
+    global _ACTIVE_INTERVAL
+    interval = "5m"  # default
+    try:
+        if STRATEGY_MANAGER_LOADED:
+            active_strategy = strategy_manager.strategy_manager.get_active_strategy()
+            if active_strategy:
+                interval = active_strategy.get_config().get("interval", "5m")
+    except Exception:
+        pass
+    _ACTIVE_INTERVAL = interval
+
+
 @app.route("/api/strategies", methods=["GET", "POST"])
 def strategies():
     if request.method == "GET":
@@ -537,6 +798,7 @@ def strategies():
 
     try:
         strategy_manager.strategy_manager.set_active_strategy(strategy_name)
+        _refresh_active_interval()
         db.log_event("INFO", f"Active strategy changed to {strategy_name}")
         return jsonify({"success": True, "strategy": strategy_name})
     except Exception as e:
@@ -551,8 +813,10 @@ def paper_balance():
 @app.route("/api/paper/reset", methods=["POST"])
 def paper_reset():
     try:
-        real_balance, _ = _get_real_balance()
+        # Seed the paper wallet from a fresh balance, not the status cache
+        real_balance, _ = _get_real_balance(force=True)
         db.set_paper_wallet_balance(real_balance)
+        _SNAPSHOTS.clear()
         db.log_event("INFO", f"Paper balance reset to {real_balance}")
         return jsonify({"success": True, "balance": real_balance})
     except Exception as e:
@@ -563,52 +827,116 @@ def paper_reset():
 
 
 
-def _ema(values, period):
-    if len(values) < period:
-        return []
+@njit(cache=True, fastmath=True)
+def _ema_last_loop(values, period):
     k = 2 / (period + 1)
-    ema = [sum(values[:period]) / period]
-    for v in values[period:]:
-        ema.append(v * k + ema[-1] * (1 - k))
+    ema = values[:period].sum() / period
+    for i in range(period, values.shape[0]):
+        ema = values[i] * k + ema * (1 - k)
     return ema
 
 
+def _ema_last(values, period):
+    """Final EMA value only (None if there are fewer than `period` values)."""
+    if values.shape[0] < period:
+        return None
+    # EMA is a first-order IIR filter: y[n] = k*x[n] + (1-k)*y[n-1]. Without
+    # numba, scipy's lfilter runs that recurrence in C.
+    if NUMBA_AVAILABLE or lfilter is None or values.shape[0] == period:
+        return _ema_last_loop(values, period)
+    k = 2 / (period + 1)
+    seed = values[:period].mean()
+    tail, _ = lfilter([k], [1.0, -(1 - k)], values[period:], zi=[(1 - k) * seed])
+    return tail[-1]
+
+
+@njit(cache=True, fastmath=True)
+def _rsi_loop(closes, period):
+    n = closes.shape[0]
+    if n < period + 1:
+        return 50.0
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        d = closes[i] - closes[i - 1]
+        if d > 0:
+            gain += d
+        else:
+            loss -= d
+    avg_gain = gain / period
+    avg_loss = loss / period
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))  # unrounded: numba's round() isn't exact
+
+
 def _rsi(closes, period):
-    if len(closes) < period + 1:
+    if NUMBA_AVAILABLE:
+        return round(float(_rsi_loop(closes, period)), 2)
+    if closes.shape[0] < period + 1:
         return 50.0
-    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-    gains = [d if d > 0 else 0 for d in deltas[-period:]]
-    losses = [-d if d < 0 else 0 for d in deltas[-period:]]
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
+    # Only the last `period` deltas matter
+    deltas = np.diff(closes[-(period + 1):])
+    avg_gain = deltas[deltas > 0].sum() / period
+    avg_loss = -deltas[deltas < 0].sum() / period
     if avg_loss == 0:
         return 100.0
     rs = avg_gain / avg_loss
-    return round(100 - (100 / (1 + rs)), 2)
+    return round(float(100 - (100 / (1 + rs))), 2)
+
+
+# Compile at import so the first readiness request doesn't pay for it
+if NUMBA_AVAILABLE:
+    _ema_last_loop(np.zeros(4), 2)
+    _rsi_loop(np.zeros(4), 2)
+
+
+class ReadinessParams(NamedTuple):
+    """Strategy settings used by readiness, resolved once per request."""
+    interval: str
+    ema_fast: int
+    ema_slow: int
+    rsi_period: int
+    overbought: float
+    oversold: float
 
 
-def _compute_readiness(closes):
+def _readiness_params():
+    """Read the active strategy's readiness settings (None if no strategy)."""
+    active_strategy = strategy_manager.strategy_manager.get_active_strategy()
+    if not active_strategy:
+        return None
+    config = active_strategy.get_config()
+    return ReadinessParams(
+        interval=config.get("interval", "1m"),
+        ema_fast=config["ema_fast"],
+        ema_slow=config["ema_slow"],
+        rsi_period=config["rsi_period"],
+        overbought=config["rsi_overbought"],
+        oversold=config["rsi_oversold"],
+    )
+
+
+def _compute_readiness(closes, params):
     """
     Compute readiness as PROXIMITY to trade conditions.
     Shows how close we are to executing (90% = ready to execute).
     """
-    active_strategy = strategy_manager.strategy_manager.get_active_strategy()
-    if not active_strategy:
+    if params is None:
         return None
-    
-    config = active_strategy.get_config()
-    ema_fast_series = _ema(closes, config["ema_fast"])
-    ema_slow_series = _ema(closes, config["ema_slow"])
-    if not ema_fast_series or not ema_slow_series:
+
+    closes = np.asarray(closes, dtype=np.float64)
+    ema_fast = _ema_last(closes, params.ema_fast)
+    ema_slow = _ema_last(closes, params.ema_slow)
+    if ema_fast is None or ema_slow is None:
         return None
 
-    ema_fast = ema_fast_series[-1]
-    ema_slow = ema_slow_series[-1]
-    rsi = _rsi(closes, config["rsi_period"])
-    overbought = config["rsi_overbought"]
-    oversold = config["rsi_oversold"]
+    rsi = _rsi(closes, params.rsi_period)
+    overbought = params.overbought
+    oversold = params.oversold
 
-    price = closes[-1] if closes else 0
+    price = closes[-1] if closes.size else 0
     gap = abs(ema_fast - ema_slow)
     gap_pct = (gap / price) if price else 0
     gap_max = 0.003  # Max gap % for scoring
@@ -643,38 +971,98 @@ def _compute_readiness(closes):
     }
 
 
+# Short-lived candle cache: candles barely change within a poll interval, so
+# repeat dashboard polls (readiness, signals, prices, charts) share one fetch
+_CANDLE_TTL = {"1m": 15.0, "3m": 30.0, "5m": 60.0, "15m": 120.0, "1h": 300.0}
+_CANDLE_MAX_AGE = 300.0  # entries older than this are dropped on the next store
+_CANDLE_CACHE = {}  # (pair, interval, limit) -> (fetched_at, candles)
+_CANDLE_LOCK = threading.Lock()
+
+
+def _get_candles_cached(client, pair, interval, limit):
+    key = (pair, interval, limit)
+    now = time.monotonic()
+    with _CANDLE_LOCK:
+        cached = _CANDLE_CACHE.get(key)
+    if cached and now - cached[0] < _CANDLE_TTL.get(interval, 60.0):
+        return cached[1]
+
+    candles = client.get_candles(pair, interval, limit=limit)
+    if candles:  # get_candles returns [] on failure; don't cache that
+        with _CANDLE_LOCK:
+            for stale in [k for k, v in _CANDLE_CACHE.items() if now - v[0] > _CANDLE_MAX_AGE]:
+                del _CANDLE_CACHE[stale]
+            _CANDLE_CACHE[key] = (now, candles)
+    return candles
+
+
+# Shared pool for concurrent per-pair CoinDCX fetches; reused across requests
+_FETCH_POOL = ThreadPoolExecutor(max_workers=20, thread_name_prefix="fetch")
+
+
+# Readiness is a pure function of the candles and strategy params, so while the
+# candle cache keeps handing back the same list the last row is reused as-is
+_READINESS_MEMO = {}  # (pair, interval) -> (candles, params, row)
+_READINESS_LOCK = threading.Lock()
+
+
+def _prune_readiness_memo():
+    """Drop memo rows whose candle list has left _CANDLE_CACHE. Caller holds _READINESS_LOCK."""
+    with _CANDLE_LOCK:
+        live = {id(entry[1]) for entry in _CANDLE_CACHE.values()}
+    # The memo keeps its list alive, so its id can't be reused by a newer list
+    for key in [k for k, memo in _READINESS_MEMO.items() if id(memo[0]) not in live]:
+        del _READINESS_MEMO[key]
+
+
+def _pair_readiness(client, pair, interval, params):
+    try:
+        candles = _get_candles_cached(client, pair, interval, 150)
+        with _READINESS_LOCK:
+            memo = _READINESS_MEMO.get((pair, interval))
+        if memo and memo[0] is candles and memo[1] == params:
+            return memo[2]
+        closes = [c.get("close") for c in candles if c.get("close") is not None]
+        readiness = _compute_readiness(closes, params)
+        # _compute_readiness may return None if not enough data; treat that as 0%
+        if readiness is None:
+            row = {
+                "pair": pair,
+                "readiness": 0.0,
+                "bias": None,
+                "ema_gap_pct": None,
+                "rsi": None,
+            }
+        else:
+            # Even readiness 0.0 is meaningful; don't filter it out
+            row = {"pair": pair, **readiness}
+        if candles:  # a failed fetch ([]) is never cached, so never memoized
+            with _READINESS_LOCK:
+                _prune_readiness_memo()
+                _READINESS_MEMO[(pair, interval)] = (candles, params, row)
+        return row
+    except Exception as e:
+        app.logger.warning(f"Readiness failed for {pair}: {e}")
+        return None
+
+
 @app.route("/api/signal/readiness")
 def signal_readiness():
     try:
         pairs_raw = request.args.get("pairs", "")
         pairs = [p.strip() for p in pairs_raw.split(",") if p.strip()]
         if not pairs:
-            return jsonify([])
+            return _empty_list_response()
 
-        client = CoinDCXREST("", "")
-        results = []
-        active_strategy = strategy_manager.strategy_manager.get_active_strategy()
-        interval = active_strategy.get_config().get("interval", "1m") if active_strategy else "1m"
-        
-        for pair in pairs[:20]:
-            try:
-                candles = client.get_candles(pair, interval, limit=150)
-                closes = [c.get("close") for c in candles if c.get("close") is not None]
-                readiness = _compute_readiness(closes)
-                # _compute_readiness may return None if not enough data; treat that as 0%
-                if readiness is None:
-                    results.append({
-                        "pair": pair,
-                        "readiness": 0.0,
-                        "bias": None,
-                        "ema_gap_pct": None,
-                        "rsi": None,
-                    })
-                else:
-                    # Even readiness 0.0 is meaningful; don't filter it out
-                    results.append({"pair": pair, **readiness})
-            except Exception as e:
-                app.logger.warning(f"Readiness failed for {pair}: {e}")
+        client = _CLIENT
+        params = _readiness_params()
+        interval = params.interval if params else "1m"
+
+        # Fetch all pairs concurrently; map() keeps the request order
+        fetched = _FETCH_POOL.map(
+            lambda pair: _pair_readiness(client, pair, interval, params), pairs[:20]
+        )
+        results = [r for r in fetched if r is not None]
         return jsonify(results)
     except Exception as e:
         import traceback
@@ -682,6 +1070,28 @@ def signal_readiness():
         return jsonify({"error": str(e), "traceback": traceback.format_exc()}), 500
 
 
+def _format_candles_fast(candles):
+    """
+    Chart rows for /api/candles built from one float64 array. Returns None if
+    any value fails to convert (numpy also maps None to NaN, so NaN is treated
+    as a failure) so the caller can fall back to per-row conversion.
+    """
+    try:
+        ohlcv = np.array(
+            [(c.get("open", 0), c.get("high", 0), c.get("low", 0),
+              c.get("close", 0), c.get("volume", 0)) for c in candles],
+            dtype=np.float64,
+        )
+    except (TypeError, ValueError):
+        return None
+    if np.isnan(ohlcv).any():
+        return None
+    return [
+        {"timestamp": c.get("time", ""), "open": o, "high": h, "low": l, "close": cl, "volume": v}
+        for c, (o, h, l, cl, v) in zip(candles, ohlcv.tolist())
+    ]
+
+
 @app.route("/api/candles")
 def get_candles():
     """Fetch OHLCV candlestick data for a pair."""
@@ -693,26 +1103,30 @@ def get_candles():
         if limit > 500:
             limit = 500
         
-        client = CoinDCXREST("", "")
-        candles = client.get_candles(pair, interval, limit=limit)
+        client = _CLIENT
+        candles = _get_candles_cached(client, pair, interval, limit)
         
         if not candles:
-            return jsonify([])
+            return _empty_list_response()
         
-        # Format for chart
-        formatted = []
-        for c in candles:
-            try:
-                formatted.append({
-                    "timestamp": c.get("time", ""),
-                    "open": float(c.get("open", 0)),
-                    "high": float(c.get("high", 0)),
-                    "low": float(c.get("low", 0)),
-                    "close": float(c.get("close", 0)),
-                    "volume": float(c.get("volume", 0))
-                })
-            except Exception:
-                pass
+        # Format for chart: convert all OHLCV columns in one numpy pass
+        formatted = _format_candles_fast(candles)
+        if formatted is None:
+            # Some candle has a missing/invalid field; convert row by row and
+            # drop the bad ones
+            formatted = []
+            for c in candles:
+                try:
+                    formatted.append({
+                        "timestamp": c.get("time", ""),
+                        "open": float(c.get("open", 0)),
+                        "high": float(c.get("high", 0)),
+                        "low": float(c.get("low", 0)),
+                        "close": float(c.get("close", 0)),
+                        "volume": float(c.get("volume", 0))
+                    })
+                except Exception:
+                    pass
         
         return jsonify(formatted)
     except Exception as e:
@@ -731,18 +1145,29 @@ def handle_api_error(error):
     raise error
 
 
+# Raw-payload debug routes are off unless ENABLE_DEBUG_ROUTES is set (env or .env)
+_DEBUG_ROUTES = bool(os.getenv("ENABLE_DEBUG_ROUTES"))
+_DEBUG_RAW_LIMIT = 20  # cap on raw rows echoed back by debug routes
+
+
+def _debug_disabled_response():
+    if _DEBUG_ROUTES or app.debug:
+        return None
+    return jsonify({"error": "disabled"}), 404
+
+
 @app.route("/api/debug/wallet")
 def debug_wallet():
+    disabled = _debug_disabled_response()
+    if disabled:
+        return disabled
     try:
-        from dotenv import load_dotenv
-        load_dotenv("/home/ubuntu/trading-bot/.env")
-        key = os.getenv("COINDCX_API_KEY")
-        secret = os.getenv("COINDCX_API_SECRET")
+        key, secret = _API_KEY, _API_SECRET
         
         if not key or not secret:
             return jsonify({"error": "API credentials not configured"}), 500
         
-        client = CoinDCXREST(key, secret)
+        client = _CLIENT
         
         # Try positions endpoint - this likely contains margin/balance
         positions_data = None
@@ -790,6 +1215,7 @@ def bot_start():
         )
         if result.returncode == 0:
             db.log_event("INFO", "Bot started manually from dashboard")
+            _BOT_STATUS["running"] = True
             return jsonify({"success": True, "message": "Bot started"})
         return jsonify({"success": False, "message": result.stderr or "Failed"}), 500
     except Exception as e:
@@ -806,62 +1232,125 @@ def bot_stop():
         )
         if result.returncode == 0:
             db.log_event("WARNING", "Bot stopped manually from dashboard")
+            _BOT_STATUS["running"] = False
             return jsonify({"success": True, "message": "Bot stopped"})
         return jsonify({"success": False, "message": result.stderr or "Failed"}), 500
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
 
-@app.route("/api/bot/status")
-def bot_status():
-    import subprocess
+@app.route("/api/admin/reload_env", methods=["POST"])
+def reload_env():
+    """Re-read the .env file so rotated API credentials take effect."""
+    try:
+        _load_env(override=True)
+        _BALANCE_CACHE["t"] = None  # next status poll uses the new keys
+        db.log_event("INFO", "Reloaded environment from dashboard")
+        return jsonify({"success": True, "credentials_configured": bool(_API_KEY and _API_SECRET)})
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+
+
+# Checking the unit (pystemd over D-Bus when installed, else a forked
+# `systemctl is-active`) is too slow per request; poll it in the background and let
+# /api/bot/status read the last value. The poller starts on first use so it
+# runs in the serving process (not a pre-fork parent).
+_BOT_STATUS = {"running": False}
+_BOT_STATUS_POLL_SEC = 2.0
+_BOT_STATUS_THREAD = None
+_BOT_STATUS_THREAD_LOCK = threading.Lock()
+_BOT_UNIT = None  # pystemd handle for bot.service, opened by the poller
+
+
+def _read_bot_active():
+    # With pystemd installed, ask systemd over D-Bus instead of forking systemctl
+    global _BOT_UNIT
+    if SystemdUnit is not None:
+        try:
+            if _BOT_UNIT is None:
+                unit = SystemdUnit(b"bot.service")
+                unit.load()
+                _BOT_UNIT = unit
+            return _BOT_UNIT.Unit.ActiveState == b"active"
+        except Exception:
+            _BOT_UNIT = None  # reconnect next time; use systemctl for now
     try:
         result = subprocess.run(
             ["/usr/bin/systemctl", "is-active", "bot"],
             capture_output=True, text=True, timeout=5
         )
-        is_running = result.stdout.strip() == "active"
-        return jsonify({"running": is_running})
+        return result.stdout.strip() == "active"
     except Exception:
-        return jsonify({"running": False})
+        return False
+
+
+def _poll_bot_status():
+    while True:
+        time.sleep(_BOT_STATUS_POLL_SEC)
+        _BOT_STATUS["running"] = _read_bot_active()
+
+
+def _ensure_bot_status_poller():
+    global _BOT_STATUS_THREAD
+    if _BOT_STATUS_THREAD is not None:
+        return
+    with _BOT_STATUS_THREAD_LOCK:
+        if _BOT_STATUS_THREAD is None:
+            _BOT_STATUS["running"] = _read_bot_active()
+            _BOT_STATUS_THREAD = threading.Thread(
+                target=_poll_bot_status, name="bot-status", daemon=True
+            )
+            _BOT_STATUS_THREAD.start()
+
+
+@app.route("/api/bot/status")
+def bot_status():
+    _ensure_bot_status_poller()
+    return jsonify({"running": _BOT_STATUS["running"]})
 
 
 # ── Pair Management ──────────────────────────
+# Instrument list changes rarely; serve it from memory for a minute
+_PAIRS_TTL = 60.0
+_PAIRS_CACHE = {"t": None, "v": None}
+
+
 @app.route("/api/pairs/available")
 def pairs_available():
     """Get all available trading pairs from CoinDCX."""
     try:
-        from dotenv import load_dotenv
-        load_dotenv("/home/ubuntu/trading-bot/.env")
-        key = os.getenv("COINDCX_API_KEY")
-        secret = os.getenv("COINDCX_API_SECRET")
+        cached_at = _PAIRS_CACHE["t"]
+        if cached_at is not None and time.monotonic() - cached_at < _PAIRS_TTL:
+            return jsonify(_PAIRS_CACHE["v"])
+
+        key, secret = _API_KEY, _API_SECRET
         
         if not key or not secret:
             return jsonify({"error": "API credentials not configured"}), 500
         
-        client = CoinDCXREST(key, secret)
+        client = _CLIENT
         instruments = client.get_active_instruments()
         
         # Filter for futures pairs and format
         # instruments is a list of strings like ["B-BTC_USDT", "B-ETH_USDT", ...]
-        pairs = []
-        for inst in instruments:
-            # Handle both string format and dict format
-            if isinstance(inst, str):
-                symbol = inst
-            elif isinstance(inst, dict):
-                symbol = inst.get("symbol", inst.get("pair", ""))
-            else:
-                continue
-                
-            if symbol and "USDT" in symbol:  # Focus on USDT pairs
-                base = symbol.replace("B-", "").replace("_USDT", "")
-                pairs.append({
-                    "pair": symbol,
-                    "base": base,
-                    "quote": "USDT"
-                })
-        
+        # (dict entries carry the symbol under "symbol" or "pair")
+        symbols = [
+            inst if isinstance(inst, str) else inst.get("symbol", inst.get("pair", ""))
+            for inst in instruments
+            if isinstance(inst, (str, dict))
+        ]
+        pairs = [
+            {
+                "pair": symbol,
+                "base": symbol.removeprefix("B-").removesuffix("_USDT"),
+                "quote": "USDT",
+            }
+            for symbol in symbols
+            if symbol and "USDT" in symbol  # Focus on USDT pairs
+        ]
+
+        _PAIRS_CACHE["v"] = pairs
+        _PAIRS_CACHE["t"] = time.monotonic()
         return jsonify(pairs)
     except Exception as e:
         app.logger.error(f"Error fetching pairs: {e}")
@@ -876,7 +1365,7 @@ def pairs_config():
         return jsonify(configs)
     except Exception as e:
         app.logger.error(f"Error fetching pair configs: {e}")
-        return jsonify([])
+        return _empty_list_response()
 
 
 @app.route("/api/pairs/config/update", methods=["POST"])
@@ -912,15 +1401,22 @@ def pairs_config_bulk():
         data = request.get_json()
         pairs = data.get("pairs", [])
         
+        # One read for every stored config instead of a lookup per pair
+        configs = {c["pair"]: c for c in db.get_all_pair_configs()}
+
+        rows = []
         for pair_data in pairs:
             pair = pair_data.get("pair")
             enabled = int(pair_data.get("enabled", 0))
             leverage = int(pair_data.get("leverage", 5))
             quantity = float(pair_data.get("quantity", 0.001))
-            inr_amount = _resolve_inr_amount(pair, pair_data.get("inr_amount"))
+            inr_amount = _resolve_inr_amount(pair, pair_data.get("inr_amount"), configs)
             
             if pair:
-                db.upsert_pair_config(pair, enabled, leverage, quantity, inr_amount)
+                rows.append((pair, enabled, leverage, quantity, inr_amount))
+
+        # One transaction (one commit) for the whole batch
+        db.upsert_pair_configs_bulk(rows)
         
         db.log_event("INFO", f"Bulk updated {len(pairs)} pair configurations")
         return jsonify({"success": True, "message": f"Updated {len(pairs)} pairs"})
@@ -933,19 +1429,9 @@ def pairs_config_bulk():
 def pairs_config_disable_all():
     """Disable all pairs at once."""
     try:
-        all_configs = db.get_all_pair_configs()
-        count = 0
-        
-        for cfg in all_configs:
-            if cfg.get("enabled") == 1:
-                db.upsert_pair_config(
-                    cfg["pair"], 
-                    0,  # disabled
-                    cfg.get("leverage", 5),
-                    cfg.get("quantity", 0.001),
-                    cfg.get("inr_amount", 300.0)
-                )
-                count += 1
+        pairs = db.get_enabled_pair_names()
+        db.bulk_set_enabled(pairs, 0)
+        count = len(pairs)
         
         db.log_event("INFO", f"Disabled all {count} enabled pairs")
         return jsonify({"success": True, "message": f"Disabled {count} pairs"})
@@ -954,6 +1440,52 @@ def pairs_config_disable_all():
         return jsonify({"error": str(e)}), 500
 
 
+# Prices come from the live futures snapshot ("ls" moves tick by tick), so only
+# share them briefly across dashboard polls; matches the 1m candle TTL
+_PRICES_TTL = 15.0
+_PRICES_CACHE = {}  # sorted pair tuple -> (fetched_at, prices)
+_PRICES_LOCK = threading.Lock()
+_PRICES_FILL_LOCK = threading.Lock()  # held by the one request refilling the cache
+
+
+def _cached_prices(cache_key):
+    with _PRICES_LOCK:
+        cached = _PRICES_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _PRICES_TTL:
+        return cached[1]
+    return None
+
+
+def _fetch_pair_prices(client, pairs):
+    prices = {}
+
+    # One snapshot call prices every instrument; "ls" is the last traded price
+    snapshot = client.get_futures_prices()
+    missing = []
+    for pair in pairs:
+        try:
+            prices[pair] = float(snapshot[pair]["ls"])
+        except (KeyError, TypeError, ValueError):
+            missing.append(pair)
+
+    # Fall back to the latest 1-minute candle for pairs the snapshot lacks
+    futures = {
+        _FETCH_POOL.submit(_get_candles_cached, client, pair, "1m", 1): pair
+        for pair in missing
+    }
+    for future in as_completed(futures):
+        pair = futures[future]
+        try:
+            candles = future.result()
+            if candles and len(candles) > 0:
+                prices[pair] = float(candles[-1].get("close", 0))
+                app.logger.debug(f"Price for {pair}: {prices[pair]}")
+        except Exception as e:
+            app.logger.warning(f"Failed to get price for {pair}: {e}")
+            continue
+    return prices
+
+
 @app.route("/api/pairs/prices")
 def pairs_prices():
     """Get current prices for all available pairs from latest signal data."""
@@ -965,37 +1497,22 @@ def pairs_prices():
         if not enabled_pairs:
             return jsonify({})
         
-        from dotenv import load_dotenv
-        load_dotenv("/home/ubuntu/trading-bot/.env")
-        key = os.getenv("COINDCX_API_KEY")
-        secret = os.getenv("COINDCX_API_SECRET")
+        # Limit to 20 pairs for speed
+        cache_key = tuple(sorted(cfg["pair"] for cfg in enabled_pairs[:20] if cfg.get("pair")))
+        prices = _cached_prices(cache_key)
+        if prices is not None:
+            return jsonify(prices)
         
-        # Use authenticated client for market data
-        if key and secret:
-            client = CoinDCXREST(key, secret)
-        else:
-            # Fallback to unauthenticated (may have limited access)
-            client = CoinDCXREST("", "")
-        
-        prices = {}
-        
-        # Fetch prices for all enabled pairs
-        for cfg in enabled_pairs[:20]:  # Limit to 20 pairs for speed
-            pair = cfg.get("pair")
-            if not pair:
-                continue
-                
-            try:
-                # Get latest 1-minute candle for current price
-                candles = client.get_candles(pair, "1m", limit=1)
-                if candles and len(candles) > 0:
-                    prices[pair] = float(candles[-1].get("close", 0))
-                    app.logger.debug(f"Price for {pair}: {prices[pair]}")
-            except Exception as e:
-                app.logger.warning(f"Failed to get price for {pair}: {e}")
-                continue
-        
-        app.logger.info(f"Loaded prices for {len(prices)} pairs")
+        # Single-flight: concurrent misses wait here, then reuse the first fetch
+        with _PRICES_FILL_LOCK:
+            prices = _cached_prices(cache_key)
+            if prices is not None:
+                return jsonify(prices)
+            prices = _fetch_pair_prices(_CLIENT, cache_key)
+            app.logger.info(f"Loaded prices for {len(prices)} pairs")
+            if prices:  # don't pin a failed fetch for a whole TTL
+                with _PRICES_LOCK:
+                    _PRICES_CACHE[cache_key] = (time.monotonic(), prices)
         return jsonify(prices)
     except Exception as e:
         app.logger.error(f"Error fetching pair prices: {e}")
@@ -1008,43 +1525,30 @@ def pairs_active():
     try:
         mode = db.get_trading_mode()
         
-        # Get all open trades grouped by pair
-        if mode == "PAPER":
-            all_trades = db.get_open_paper_trades()
-        else:
-            all_trades = db.get_open_trades()
+        stats, all_trades = db.get_open_trade_stats_by_pair(mode)
         
-        # Group by pair
+        # Stitch trades onto their pair, keeping first-seen pair order
         pairs_trading = {}
         for trade in all_trades:
             pair = trade.get("pair")
-            if pair not in pairs_trading:
-                pairs_trading[pair] = {
+            pair_info = pairs_trading.get(pair)
+            if pair_info is None:
+                agg = stats[pair]
+                pair_info = pairs_trading[pair] = {
                     "pair": pair,
-                    "open_positions": 0,
-                    "total_confidence": 0.0,
-                    "avg_confidence": 0.0,
+                    "open_positions": agg["open_positions"],
+                    "total_confidence": agg["total_confidence"],
+                    "avg_confidence": round(agg["total_confidence"] / agg["open_positions"], 1),
                     "trades": []
                 }
-            
-            pairs_trading[pair]["open_positions"] += 1
-            confidence = float(trade.get("confidence", 0))
-            pairs_trading[pair]["total_confidence"] += confidence
-            pairs_trading[pair]["trades"].append({
+            pair_info["trades"].append({
                 "id": trade.get("id"),
                 "side": trade.get("side"),
                 "entry_price": float(trade.get("entry_price", 0)),
-                "confidence": confidence,
+                "confidence": float(trade.get("confidence", 0)),
                 "opened_at": trade.get("opened_at")
             })
         
-        # Calculate averages
-        for pair_info in pairs_trading.values():
-            if pair_info["open_positions"] > 0:
-                pair_info["avg_confidence"] = round(
-                    pair_info["total_confidence"] / pair_info["open_positions"], 1
-                )
-        
         return jsonify({
             "mode": mode,
             "active_pairs": list(pairs_trading.values()),
@@ -1064,65 +1568,43 @@ def trades_by_pair():
         limit = int(request.args.get("limit", 100))
         mode = db.get_trading_mode()
         
-        if mode == "PAPER":
-            all_trades = db.get_all_paper_trades(limit)
-        else:
-            all_trades = db.get_all_trades(limit)
+        stats, all_trades = db.get_trade_stats_by_pair(mode, limit)
         
-        # Group by pair
+        # Stitch recent trades onto their pair, keeping first-seen pair order
         pairs_stats = {}
         for trade in all_trades:
             pair = trade.get("pair")
-            if pair not in pairs_stats:
-                pairs_stats[pair] = {
+            pair_info = pairs_stats.get(pair)
+            if pair_info is None:
+                agg = stats[pair]
+                total = agg["total_trades"]
+                closed = total - agg["open_trades"]
+                pair_info = pairs_stats[pair] = {
                     "pair": pair,
-                    "total_trades": 0,
-                    "open_trades": 0,
-                    "closed_trades": 0,
-                    "total_confidence": 0.0,
-                    "avg_confidence": 0.0,
-                    "total_pnl": 0.0,
-                    "win_rate": 0.0,
+                    "total_trades": total,
+                    "open_trades": agg["open_trades"],
+                    "closed_trades": closed,
+                    "total_confidence": agg["total_confidence"],
+                    "avg_confidence": round(agg["total_confidence"] / total, 1),
+                    "total_pnl": agg["total_pnl"],
+                    "win_rate": round(agg["wins"] / closed * 100, 1) if closed else 0.0,
                     "recent_trades": []
                 }
             
             status = trade.get("status", "")
-            confidence = float(trade.get("confidence", 0))
             pnl = float(trade.get("pnl") or 0) if status == "closed" else None
-            
-            pairs_stats[pair]["total_trades"] += 1
-            pairs_stats[pair]["total_confidence"] += confidence
-            
-            if status == "open":
-                pairs_stats[pair]["open_trades"] += 1
-            else:
-                pairs_stats[pair]["closed_trades"] += 1
-                if pnl is not None:
-                    pairs_stats[pair]["total_pnl"] += pnl
-            
-            pairs_stats[pair]["recent_trades"].append({
+            pair_info["recent_trades"].append({
                 "id": trade.get("id"),
                 "side": trade.get("side"),
                 "status": status,
                 "entry_price": float(trade.get("entry_price", 0)),
                 "exit_price": float(trade.get("exit_price") or 0) if status == "closed" else None,
-                "confidence": confidence,
+                "confidence": float(trade.get("confidence", 0)),
                 "pnl": pnl,
                 "opened_at": trade.get("opened_at"),
                 "closed_at": trade.get("closed_at")
             })
         
-        # Calculate averages
-        for pair_info in pairs_stats.values():
-            if pair_info["total_trades"] > 0:
-                pair_info["avg_confidence"] = round(
-                    pair_info["total_confidence"] / pair_info["total_trades"], 1
-                )
-            if pair_info["closed_trades"] > 0:
-                wins = sum(1 for t in pair_info["recent_trades"] 
-                          if t["pnl"] is not None and t["pnl"] > 0)
-                pair_info["win_rate"] = round(wins / pair_info["closed_trades"] * 100, 1)
-        
         return jsonify({
             "mode": mode,
             "pairs_stats": list(pairs_stats.values()),
@@ -1179,7 +1661,7 @@ def pair_signals():
         
         if not enabled_pairs:
             app.logger.info("No enabled pairs found. Enable pairs in Pair Manager.")
-            return jsonify([])
+            return _empty_list_response()
         
         # Import strategy to calculate signal strength
         try:
@@ -1188,24 +1670,27 @@ def pair_signals():
             app.logger.error(f"Failed to import strategy: {e}")
             return jsonify({"error": "Strategy module not available"}), 500
         
-        client = CoinDCXREST("", "")
+        client = _CLIENT
         results = []
         
-        # Get active strategy config for interval
-        active_strategy = None
-        interval = "5m"  # default
-        try:
-            if STRATEGY_MANAGER_LOADED:
-                active_strategy = strategy_manager.strategy_manager.get_active_strategy()
-                if active_strategy:
-                    interval = active_strategy.get_config().get("interval", "5m")
-        except Exception:
-            pass
+        # Active strategy's candle interval (kept current by the strategy route)
+        interval = _ACTIVE_INTERVAL
         
         # Process only enabled pairs (limit to 10 max for performance)
         # This keeps response time under 20 seconds
         pairs_to_process = enabled_pairs[:10]
         app.logger.info(f"Processing {len(pairs_to_process)} enabled pairs for signal strength")
+        # Sort key per results row; rows that fail or lack candles stay at 0.0
+        strengths = np.zeros(len(pairs_to_process))
+        scored = []  # (results index, pair, candles) awaiting a strength score
+
+        # Start every candle fetch up front so the network waits overlap;
+        # the strategy loop below then consumes them in order
+        fetches = {
+            pair: _FETCH_POOL.submit(_get_candles_cached, client, pair, interval, 150)
+            for pair in (cfg.get("pair") for cfg in pairs_to_process)
+            if pair
+        }
         
         for idx, pair_config in enumerate(pairs_to_process, 1):
             pair = pair_config.get("pair")
@@ -1213,9 +1698,9 @@ def pair_signals():
                 continue
             
             try:
-                # Fetch candles for this pair
+                # Wait for this pair's candles
                 app.logger.debug(f"[{idx}/{len(pairs_to_process)}] Fetching candles for {pair}")
-                candles = client.get_candles(pair, interval, limit=150)
+                candles = fetches[pair].result()
                 
                 if not candles or len(candles) < 50:
                     results.append({
@@ -1228,19 +1713,17 @@ def pair_signals():
                     })
                     continue
                 
-                # Calculate signal strength
-                signal_strength = strategy.calculate_signal_strength(candles)
-                
+                # Scored together with the other pairs after the loop
+                scored.append((len(results), pair, candles))
                 results.append({
                     "pair": pair,
-                    "signal_strength": signal_strength,
+                    "signal_strength": 0.0,
                     "enabled": pair_config.get("enabled", 0),
                     "leverage": pair_config.get("leverage", 5),
                     "quantity": pair_config.get("quantity", 0.001),
                     "inr_amount": pair_config.get("inr_amount", 300.0),
                     "last_price": candles[-1].get("close") if candles else None
                 })
-                app.logger.debug(f"[{idx}/{len(pairs_to_process)}] {pair}: signal={signal_strength:.1f}%")
             except Exception as e:
                 app.logger.warning(f"Signal strength calculation failed for {pair}: {e}")
                 results.append({
@@ -1252,8 +1735,28 @@ def pair_signals():
                     "inr_amount": pair_config.get("inr_amount", 300.0)
                 })
         
+        # Score every pair with enough candles in one batch call; if that
+        # fails, score pair by pair so one bad series only zeroes itself
+        if scored:
+            try:
+                batch = strategy.calculate_signal_strengths([candles for _, _, candles in scored])
+            except Exception:
+                batch = None
+            for n, (i, pair, candles) in enumerate(scored):
+                try:
+                    signal_strength = batch[n] if batch is not None else strategy.calculate_signal_strength(candles)
+                except Exception as e:
+                    app.logger.warning(f"Signal strength calculation failed for {pair}: {e}")
+                    del results[i]["last_price"]
+                    continue
+                results[i]["signal_strength"] = signal_strength
+                strengths[i] = signal_strength
+                app.logger.debug(f"{pair}: signal={signal_strength:.1f}%")
+        
         # Sort by signal strength (highest first)
-        results.sort(key=lambda x: x["signal_strength"], reverse=True)
+        # (stable, so ties keep their enabled-pairs order like list.sort did)
+        order = np.argsort(-strengths[:len(results)], kind="stable")
+        results = [results[i] for i in order]
         
         app.logger.info(f"Pair signals ready: {len(results)} pairs, top signal: {results[0]['signal_strength']:.1f}% ({results[0]['pair']})" if results else "No pairs processed")
         
@@ -1263,59 +1766,136 @@ def pair_signals():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/pair_signals/stream")
+def pair_signals_stream():
+    """
+    Same rows as /api/pair_signals, streamed as Server-Sent Events in the
+    order pairs finish (unsorted), so a client can render the fastest pairs
+    first. Ends with a `done` event.
+    """
+    enabled_pairs = db.get_enabled_pairs()
+    try:
+        import strategy
+    except Exception as e:
+        app.logger.error(f"Failed to import strategy: {e}")
+        return jsonify({"error": "Strategy module not available"}), 500
+
+    client = _CLIENT
+    interval = _ACTIVE_INTERVAL
+    futures = {
+        _FETCH_POOL.submit(_get_candles_cached, client, cfg["pair"], interval, 150): cfg
+        for cfg in enabled_pairs[:10]
+        if cfg.get("pair")
+    }
+
+    def generate():
+        for future in as_completed(futures):
+            pair_config = futures[future]
+            pair = pair_config["pair"]
+            row = {
+                "pair": pair,
+                "signal_strength": 0.0,
+                "enabled": pair_config.get("enabled", 0),
+                "leverage": pair_config.get("leverage", 5),
+                "quantity": pair_config.get("quantity", 0.001),
+                "inr_amount": pair_config.get("inr_amount", 300.0)
+            }
+            try:
+                candles = future.result()
+                if candles and len(candles) >= 50:
+                    last_price = candles[-1].get("close")
+                    row["signal_strength"] = strategy.calculate_signal_strength(candles)
+                    row["last_price"] = last_price
+            except Exception as e:
+                app.logger.warning(f"Signal strength calculation failed for {pair}: {e}")
+            yield f"data: {app.json.dumps(row)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return app.response_class(
+        generate(),
+        mimetype="text/event-stream",
+        # nginx buffers proxied responses unless told otherwise
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Field fallbacks for CoinDCX position rows, in priority order
+_MARK_PRICE_KEYS = ("mark_price", "index_price", "last_price", "current_price", "price")
+_UNREALIZED_PNL_KEYS = ("unrealized_pnl", "mtm_pnl", "pnl")
+
+# Epoch-ms range (1970 .. 2106) where numpy and datetime.fromtimestamp(ms / 1000.0)
+# agree exactly; anything else takes the scalar path
+_MS_MIN = 0
+_MS_MAX = 2 ** 32 * 1000
+
+
+def _first_float(row, keys):
+    """First value under `keys` that parses as a float, else None."""
+    for key_name in keys:
+        raw = row.get(key_name)
+        if raw is not None:
+            try:
+                return float(raw)
+            except (TypeError, ValueError):
+                continue
+    return None
+
+
+def _ms_to_ist_strings(stamps):
+    """
+    Convert epoch-millisecond ints to IST ISO-8601 strings in one pass, formatted
+    like datetime.isoformat() (fraction only when non-zero, in microseconds).
+    """
+    ist = np.array(stamps, dtype=np.int64).astype("datetime64[ms]") + _IST_OFFSET
+    return [
+        (s[:19] if s.endswith(".000") else s + "000") + "+05:30"
+        for s in np.datetime_as_string(ist, unit="ms").tolist()
+    ]
+
+
+# Compact JSON for the List Positions request; only the timestamp varies.
+# IMPORTANT: Platform shows positions under INR margin wallet,
+# so we must request INR-margined positions here.
+_POSITIONS_BODY = '{"timestamp":%d,"page":"1","size":"100","margin_currency_short_name":["INR"]}'
+
+
 @app.route("/api/live/positions")
 def live_positions():
     """Get actual open positions from CoinDCX using List Positions endpoint."""
     try:
-        import hmac
-        import hashlib
-        import time
-        import json
-        import requests
-        from dotenv import load_dotenv
-        
-        load_dotenv("/home/ubuntu/trading-bot/.env")
-        key = os.getenv("COINDCX_API_KEY")
-        secret = os.getenv("COINDCX_API_SECRET")
+        key, secret = _API_KEY, _API_SECRET
 
         if not key or not secret:
             return jsonify({"error": "API credentials not configured"}), 500
 
         # Use List Positions endpoint and request INR-margined futures
-        timeStamp = int(round(time.time() * 1000))
-        body = {
-            "timestamp": timeStamp,
-            "page": "1",
-            "size": "100",
-            # IMPORTANT: Platform shows positions under INR margin wallet,
-            # so we must request INR-margined positions here.
-            "margin_currency_short_name": ["INR"]
-        }
-        
-        json_body = json.dumps(body, separators=(',', ':'))
-        secret_bytes = bytes(secret, encoding='utf-8')
-        signature = hmac.new(secret_bytes, json_body.encode(), hashlib.sha256).hexdigest()
+        json_body = _POSITIONS_BODY % round(time.time() * 1000)
+        signature = _sign(secret, json_body)
         
         headers = {
-            'Content-Type': 'application/json',
             'X-AUTH-APIKEY': key,
             'X-AUTH-SIGNATURE': signature
         }
         
-        resp = requests.post(
+        resp = _HTTP.post(
             "https://api.coindcx.com/exchange/v1/derivatives/futures/positions",
             data=json_body,
             headers=headers,
             timeout=10
         )
         resp.raise_for_status()
-        positions = resp.json()
+        positions = _resp_json(resp)
         
         if not isinstance(positions, list):
-            return jsonify([])
+            return _empty_list_response()
 
         # Filter for actual open positions (active_pos != 0)
         result = []
+        # Rows with a usable mark price get their P&L computed in one
+        # vectorized pass after parsing: (result index, entry, mark, signed qty, leverage, rate)
+        pnl_idx, pnl_entry, pnl_mark, pnl_qty, pnl_lev, pnl_rate = [], [], [], [], [], []
+        # Same for integer millisecond open times -> IST ISO strings
+        ts_idx, ts_ms = [], []
         for pos in positions:
             try:
                 active_pos = pos.get("active_pos", 0)
@@ -1335,19 +1915,13 @@ def live_positions():
                 locked_margin = float(pos.get("locked_margin", 0) or 0)
 
                 # Mark / index price for live P&L (fallback to any reasonable field)
-                mark_price = None
-                for key_name in ("mark_price", "index_price", "last_price", "current_price", "price"):
-                    raw = pos.get(key_name)
-                    if raw is not None:
-                        try:
-                            mark_price = float(raw)
-                            break
-                        except (TypeError, ValueError):
-                            continue
+                mark_price = _first_float(pos, _MARK_PRICE_KEYS)
 
                 # Compute unrealized P&L in INR if possible
                 unrealized_pnl = None
-                if mark_price is not None and entry_price and quantity:
+                settlement_rate = None
+                pnl_computable = mark_price is not None and entry_price and quantity
+                if pnl_computable:
                     # If settlement_currency_avg_price is provided (e.g. INR/USDT),
                     # use it to convert P&L into INR to match platform display.
                     settlement_rate_raw = pos.get("settlement_currency_avg_price")
@@ -1355,23 +1929,9 @@ def live_positions():
                         settlement_rate = float(settlement_rate_raw) if settlement_rate_raw not in (None, 0, "") else None
                     except (TypeError, ValueError):
                         settlement_rate = None
-
-                    price_diff = (mark_price - entry_price) if side == "buy" else (entry_price - mark_price)
-                    if settlement_rate and settlement_rate > 0:
-                        unrealized_pnl = price_diff * quantity * leverage * settlement_rate
-                    else:
-                        # Fallback: units will be in quote currency (e.g. USDT)
-                        unrealized_pnl = price_diff * quantity * leverage
                 else:
                     # Fallback: try API-provided unrealized fields if any
-                    for key_name in ("unrealized_pnl", "mtm_pnl", "pnl"):
-                        raw = pos.get(key_name)
-                        if raw is not None:
-                            try:
-                                unrealized_pnl = float(raw)
-                                break
-                            except (TypeError, ValueError):
-                                continue
+                    unrealized_pnl = _first_float(pos, _UNREALIZED_PNL_KEYS)
 
                 # Get TP/SL from triggers (may be null for manual positions)
                 tp_price = pos.get("take_profit_trigger")
@@ -1380,11 +1940,13 @@ def live_positions():
                 # Convert timestamp (ms since epoch) to IST ISO string for dashboard
                 opened_raw = pos.get("activation_time") or pos.get("updated_at") or pos.get("created_at")
                 opened_at = None
-                from datetime import datetime, timezone
+                opened_ms = None
                 try:
-                    if isinstance(opened_raw, (int, float)):
-                        dt = datetime.fromtimestamp(opened_raw / 1000.0, tz=timezone.utc)
-                        opened_at = dt.astimezone(IST).isoformat()
+                    if isinstance(opened_raw, int) and _MS_MIN <= opened_raw < _MS_MAX:
+                        opened_ms = opened_raw  # converted with the rest below
+                    elif isinstance(opened_raw, (int, float)):
+                        # Fixed offset, so build the IST datetime directly (no astimezone hop)
+                        opened_at = datetime.fromtimestamp(opened_raw / 1000.0, tz=IST).isoformat()
                     elif isinstance(opened_raw, str) and opened_raw:
                         opened_at = opened_raw
                 except Exception:
@@ -1406,9 +1968,33 @@ def live_positions():
                     "status": "open",
                     "source": "live"
                 })
+                if opened_ms is not None:
+                    ts_idx.append(len(result) - 1)
+                    ts_ms.append(opened_ms)
+                if pnl_computable:
+                    pnl_idx.append(len(result) - 1)
+                    pnl_entry.append(entry_price)
+                    pnl_mark.append(mark_price)
+                    pnl_qty.append(qty)
+                    pnl_lev.append(leverage)
+                    # Fallback: units will be in quote currency (e.g. USDT)
+                    pnl_rate.append(settlement_rate if settlement_rate and settlement_rate > 0 else 1.0)
             except Exception as inner_e:
                 app.logger.warning(f"Failed to parse live position row: {inner_e} | raw={pos}")
 
+        if pnl_idx:
+            qty_arr = np.array(pnl_qty, dtype=np.float64)
+            entry_arr = np.array(pnl_entry, dtype=np.float64)
+            mark_arr = np.array(pnl_mark, dtype=np.float64)
+            price_diff = np.where(qty_arr > 0, mark_arr - entry_arr, entry_arr - mark_arr)
+            pnl = (price_diff * np.abs(qty_arr) * np.array(pnl_lev, dtype=np.float64)
+                   * np.array(pnl_rate, dtype=np.float64))
+            for i, value in zip(pnl_idx, pnl.tolist()):
+                result[i]["unrealized_pnl"] = value
+        if ts_idx:
+            for i, opened_at in zip(ts_idx, _ms_to_ist_strings(ts_ms)):
+                result[i]["opened_at"] = opened_at
+
         return jsonify(result)
 
     except Exception as e:
@@ -1419,16 +2005,16 @@ def live_positions():
 @app.route("/api/debug/positions")
 def debug_positions():
     """Debug endpoint - returns raw CoinDCX positions response to identify field names."""
+    disabled = _debug_disabled_response()
+    if disabled:
+        return disabled
     try:
-        from dotenv import load_dotenv
-        load_dotenv("/home/ubuntu/trading-bot/.env")
-        key = os.getenv("COINDCX_API_KEY")
-        secret = os.getenv("COINDCX_API_SECRET")
+        key, secret = _API_KEY, _API_SECRET
         if not key or not secret:
             return jsonify({"error": "No credentials"}), 500
-        client = CoinDCXREST(key, secret)
+        client = _CLIENT
         positions = client.get_positions()
-        return jsonify({"count": len(positions), "raw": positions})
+        return jsonify({"count": len(positions), "raw": positions[:_DEBUG_RAW_LIMIT]})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -6,26 +6,13 @@ Run this to debug which endpoint works for fetching your wallet balance.
 
 import os
 import sys
-import json
 import hmac
 import hashlib
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 
-# Load environment variables manually (no dependencies needed)
-def load_env_file(filepath=".env"):
-    """Simple .env file parser without requiring python-dotenv"""
-    env_vars = {}
-    try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
-    except FileNotFoundError:
-        pass
-    return env_vars
+from _env import load_env_file
+from coindcx_http import decode_response, encode_body, get_session, pretty
 
 # Try multiple .env locations
 env_vars = load_env_file(".env") or load_env_file("/home/ubuntu/trading-bot/.env")
@@ -41,6 +28,8 @@ print(f"✓ API Key: {API_KEY[:10]}...{API_KEY[-4:]}")
 print(f"✓ API Secret: ***{API_SECRET[-4:]}")
 print()
 
+_SECRET = API_SECRET.encode('utf-8')  # signing key, encoded once
+
 # Test endpoints for futures wallet balance
 TEST_ENDPOINTS = [
     # Futures-specific endpoints (based on CoinDCX docs pattern)
@@ -68,19 +57,18 @@ TEST_ENDPOINTS = [
 
 BASE_URL = "https://api.coindcx.com"
 
+# Probes run in parallel over the shared coindcx_http session (pool of 10)
+MAX_WORKERS = 6
+
 
 def test_endpoint(path, method="POST"):
     """Test a single endpoint with both POST and GET methods."""
     try:
-        body = {"timestamp": int(time.time() * 1000)}
+        body = {"timestamp": time.time_ns() // 1_000_000}
         
-        # Create signature
-        json_body = json.dumps(body, separators=(",", ":"))
-        signature = hmac.new(
-            API_SECRET.encode(),
-            json_body.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        # Create signature over the exact bytes that are sent
+        message = encode_body(body)
+        signature = hmac.new(_SECRET, message, hashlib.sha256).hexdigest()
         
         headers = {
             "Content-Type": "application/json",
@@ -91,14 +79,14 @@ def test_endpoint(path, method="POST"):
         url = BASE_URL + path
         
         if method == "POST":
-            response = requests.post(url, headers=headers, json=body, timeout=10)
+            response = get_session().post(url, headers=headers, data=message, timeout=10)
         else:
-            response = requests.get(url, headers=headers, json=body, timeout=10)
+            response = get_session().get(url, headers=headers, data=message, timeout=10)
         
         return {
             "status_code": response.status_code,
             "success": 200 <= response.status_code < 300,
-            "response": response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text[:200],
+            "response": decode_response(response) if response.headers.get('content-type', '').startswith('application/json') else response.text[:200],
         }
         
     except Exception as e:
@@ -165,19 +153,25 @@ print()
 
 successful_endpoints = []
 
+# Probe everything in parallel, then report in the original order
+METHODS = ("POST", "GET")
+tasks = [(endpoint, method) for endpoint in TEST_ENDPOINTS for method in METHODS]
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+    results = dict(zip(tasks, ex.map(lambda t: test_endpoint(*t), tasks)))
+
 for endpoint in TEST_ENDPOINTS:
     print(f"Testing: {endpoint}")
     print("-" * 70)
     
-    for method in ["POST", "GET"]:
-        result = test_endpoint(endpoint, method)
+    for method in METHODS:
+        result = results[(endpoint, method)]
         
         status_icon = "✅" if result["success"] else "❌"
         print(f"  {status_icon} {method:4} → Status: {result['status_code']}")
         
         if result["success"]:
             response_data = result.get("response", {})
-            print(f"      Response preview: {json.dumps(response_data, indent=2)[:300]}...")
+            print(f"      Response preview: {pretty(response_data)[:300]}...")
             
             # Try to extract balance
             balance = extract_balance_from_response(response_data)
@@ -191,7 +185,7 @@ for endpoint in TEST_ENDPOINTS:
                 })
             else:
                 print(f"      ⚠️  Response received but couldn't extract balance")
-                print(f"      Full response: {json.dumps(response_data, indent=2)}")
+                print(f"      Full response: {pretty(response_data)}")
         elif "error" in result:
             print(f"      ❌ Connection Error: {result['error']}")
         else:
@@ -213,7 +207,7 @@ if successful_endpoints:
         print(f"   Endpoint: {ep['endpoint']}")
         print(f"   Method:   {ep['method']}")
         print(f"   Balance:  {ep['balance']} USDT")
-        print(f"   Response: {json.dumps(ep['response'], indent=2)[:300]}...")
+        print(f"   Response: {pretty(ep['response'])[:300]}...")
         print()
 else:
     print("\n❌ No working endpoints found!")
@@ -6,25 +6,13 @@ Based on: https://docs.coindcx.com/
 
 import os
 import sys
-import json
 import hmac
 import hashlib
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 
-# Load .env manually
-def load_env_file(filepath=".env"):
-    env_vars = {}
-    try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
-    except FileNotFoundError:
-        pass
-    return env_vars
+from _env import load_env_file
+from coindcx_http import VERBOSE, decode_response, encode_body, get_session, pretty
 
 env_vars = load_env_file(".env") or load_env_file("/home/ubuntu/trading-bot/.env")
 API_KEY = env_vars.get("COINDCX_API_KEY") or os.getenv("COINDCX_API_KEY")
@@ -37,20 +25,20 @@ if not API_KEY or not API_SECRET:
 print(f"✓ API Key: {API_KEY[:10]}...{API_KEY[-4:]}")
 print(f"✓ API Secret: ***{API_SECRET[-4:]}\n")
 
-def make_request(endpoint, method="POST"):
-    """Make authenticated request to CoinDCX API"""
-    
+_SECRET = API_SECRET.encode('utf-8')  # signing key, encoded once
+
+def sign_body():
+    """Build the signed body and its headers; every probe in a run can share them."""
     # Create request body with timestamp
     body = {
-        "timestamp": int(time.time() * 1000)
+        "timestamp": time.time_ns() // 1_000_000
     }
     
     # Create signature (EXACT format from CoinDCX docs)
-    secret_bytes = bytes(API_SECRET, encoding='utf-8')
-    json_body = json.dumps(body, separators=(',', ':'))
-    message = bytes(json_body, encoding='utf-8')
+    message = encode_body(body)
+    json_body = message.decode('utf-8')
     
-    signature = hmac.new(secret_bytes, message, hashlib.sha256).hexdigest()
+    signature = hmac.new(_SECRET, message, hashlib.sha256).hexdigest()
     
     # Headers (EXACT format from CoinDCX docs)
     headers = {
@@ -58,38 +46,51 @@ def make_request(endpoint, method="POST"):
         'X-AUTH-APIKEY': API_KEY,
         'X-AUTH-SIGNATURE': signature
     }
+    return json_body, headers
+
+def make_request(endpoint, json_body, headers, method="POST"):
+    """
+    Make authenticated request to CoinDCX API.
+    Returns (data, report): the parsed JSON (or None) and the text to print.
+    Output is collected rather than printed so parallel probes don't interleave.
+    """
+    out = []
     
     url = f"https://api.coindcx.com{endpoint}"
     
-    print(f"\n{'='*70}")
-    print(f"Testing: {method} {endpoint}")
-    print(f"{'='*70}")
-    print(f"Request body: {json_body}")
-    print(f"Signature: {signature[:20]}...")
+    out.append(f"\n{'='*70}")
+    out.append(f"Testing: {method} {endpoint}")
+    out.append(f"{'='*70}")
+    out.append(f"Request body: {json_body}")
+    out.append(f"Signature: {headers['X-AUTH-SIGNATURE'][:20]}...")
     
     try:
         if method == "POST":
-            response = requests.post(url, data=json_body, headers=headers, timeout=10)
+            response = get_session().post(url, data=json_body, headers=headers, timeout=10)
         else:
-            response = requests.get(url, data=json_body, headers=headers, timeout=10)
+            response = get_session().get(url, data=json_body, headers=headers, timeout=10)
         
-        print(f"Status Code: {response.status_code}")
-        print(f"Response Headers: {dict(response.headers)}")
+        out.append(f"Status Code: {response.status_code}")
+        if VERBOSE:
+            out.append(f"Response Headers: {dict(response.headers)}")
         
         # Try to parse JSON response
         try:
-            data = response.json()
-            print(f"\nResponse JSON:")
-            print(json.dumps(data, indent=2))
-            return data
+            data = decode_response(response)
+            if VERBOSE:
+                out.append(f"\nResponse JSON:")
+                out.append(pretty(data))
+            else:
+                out.append("\nResponse JSON received (set COINDCX_VERBOSE=1 to print it)")
+            return data, "\n".join(out)
         except:
-            print(f"\nResponse Text:")
-            print(response.text)
-            return None
+            out.append(f"\nResponse Text:")
+            out.append(response.text)
+            return None, "\n".join(out)
             
     except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+        out.append(f"❌ Error: {e}")
+        return None, "\n".join(out)
 
 # Test these endpoints based on CoinDCX patterns
 print("\n" + "="*70)
@@ -107,12 +108,24 @@ endpoints_to_test = [
     "/exchange/v1/derivatives/futures/account",
 ]
 
-for endpoint in endpoints_to_test:
-    result = make_request(endpoint, "POST")
+# The probes go out within milliseconds of each other, so they all share
+# one timestamped body and one (read-only) headers dict
+json_body, headers = sign_body()
+
+# Probe all endpoints at once over the shared session; map() keeps the
+# reports in endpoint order
+with ThreadPoolExecutor(max_workers=len(endpoints_to_test)) as ex:
+    probes = list(ex.map(lambda ep: make_request(ep, json_body, headers), endpoints_to_test))
+
+BALANCE_HINTS = (b'balance', b'wallet', b'usdt', b'inr')
+
+for result, report in probes:
+    print(report)
     
     if result and isinstance(result, dict):
-        # Look for balance fields
-        if any(key in str(result).lower() for key in ['balance', 'wallet', 'usdt', 'inr']):
+        # Look for balance fields in the compact JSON rather than repr()
+        text = encode_body(result).lower()
+        if any(key in text for key in BALANCE_HINTS):
             print("\n💰 POTENTIAL BALANCE DATA FOUND!")
             
 print("\n" + "="*70)
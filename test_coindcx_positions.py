@@ -7,11 +7,11 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from bot.coindcx import CoinDCXREST
 from dotenv import load_dotenv
-import json
 import hmac
 import hashlib
 import time
-import requests
+
+from coindcx_http import decode_response, encode_body, get_session, pretty
 
 # Load credentials from server
 load_dotenv("/home/ubuntu/trading-bot/.env")
@@ -22,6 +22,8 @@ if not key or not secret:
     print("ERROR: No API credentials found")
     sys.exit(1)
 
+_SECRET = secret.encode('utf-8')  # signing key, encoded once
+
 print("Connecting to CoinDCX...")
 
 print("\n" + "="*60)
@@ -29,15 +31,16 @@ print("Testing LIST POSITIONS endpoint (per documentation)")
 print("="*60)
 
 # Use the documented endpoint for listing positions
-timeStamp = int(round(time.time() * 1000))
+timeStamp = time.time_ns() // 1_000_000
 body = {
     "timestamp": timeStamp,
     "page": "1",
     "size": "100",
     "margin_currency_short_name": ["INR"]
 }
-json_body = json.dumps(body, separators=(',', ':'))
-signature = hmac.new(bytes(secret, encoding='utf-8'), json_body.encode(), hashlib.sha256).hexdigest()
+message = encode_body(body)
+json_body = message.decode('utf-8')
+signature = hmac.new(_SECRET, message, hashlib.sha256).hexdigest()
 
 url = "https://api.coindcx.com/exchange/v1/derivatives/futures/positions"
 headers = {
@@ -46,15 +49,22 @@ headers = {
     'X-AUTH-SIGNATURE': signature
 }
 
-response = requests.post(url, data=json_body, headers=headers)
-positions = response.json()
+response = get_session().post(url, data=json_body, headers=headers)
+positions = decode_response(response)
 
 print(f"Response type: {type(positions)}")
 print(f"Total positions returned: {len(positions) if isinstance(positions, list) else 'N/A'}")
 
 if isinstance(positions, list):
-    # Filter for positions with active_pos != 0 (actual open positions)
-    active = [p for p in positions if p.get('active_pos', 0) != 0]
+    # One pass: open positions (active_pos != 0) and PIPPIN/PEPE configs
+    active = []
+    pippin = []
+    for p in positions:
+        if p.get('active_pos', 0) != 0:
+            active.append(p)
+        pair = (p.get('pair') or '').upper()
+        if 'PIP' in pair or 'PEPE' in pair:
+            pippin.append(p)
     print(f"\nPositions with active_pos != 0: {len(active)}")
     
     if active:
@@ -65,14 +75,13 @@ if isinstance(positions, list):
             print(f"  avg_price: {p.get('avg_price')}")
             print(f"  locked_margin: {p.get('locked_margin')}")
             print(f"  leverage: {p.get('leverage')}")
-            print(json.dumps(p, indent=2))
+            print(pretty(p))
     else:
         print("\n❌ NO ACTIVE POSITIONS (all active_pos = 0)")
         print("\nChecking for PIPPIN/1000PEPE specifically:")
-        pippin = [p for p in positions if 'PIP' in p.get('pair', '').upper() or 'PEPE' in p.get('pair', '').upper()]
         if pippin:
             print("Found PIPPIN/PEPE position config:")
-            print(json.dumps(pippin[0], indent=2))
+            print(pretty(pippin[0]))
         else:
             print("No PIPPIN/PEPE found. Checking first 3 positions:")
             for p in positions[:3]:
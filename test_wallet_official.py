@@ -6,25 +6,12 @@ Based on: https://docs.coindcx.com/#wallet-details
 
 import os
 import sys
-import json
 import hmac
 import hashlib
 import time
-import requests
 
-# Load .env manually
-def load_env_file(filepath=".env"):
-    env_vars = {}
-    try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
-    except FileNotFoundError:
-        pass
-    return env_vars
+from _env import load_env_file
+from coindcx_http import VERBOSE, decode_response, encode_body, get_session, pretty
 
 env_vars = load_env_file(".env") or load_env_file("/home/ubuntu/trading-bot/.env")
 API_KEY = env_vars.get("COINDCX_API_KEY") or os.getenv("COINDCX_API_KEY")
@@ -34,6 +21,8 @@ if not API_KEY or not API_SECRET:
     print("❌ Error: API credentials not found")
     sys.exit(1)
 
+_SECRET = API_SECRET.encode('utf-8')  # signing key, encoded once
+
 print("="*70)
 print("Testing CoinDCX Futures Wallet API (Official Endpoint)")
 print("="*70)
@@ -42,11 +31,10 @@ print(f"API Secret: ***{API_SECRET[-4:]}")
 print()
 
 # Create signature
-body = {"timestamp": int(time.time() * 1000)}
-secret_bytes = bytes(API_SECRET, encoding='utf-8')
-json_body = json.dumps(body, separators=(',', ':'))
-message = bytes(json_body, encoding='utf-8')
-signature = hmac.new(secret_bytes, message, hashlib.sha256).hexdigest()
+body = {"timestamp": time.time_ns() // 1_000_000}
+message = encode_body(body)
+json_body = message.decode('utf-8')
+signature = hmac.new(_SECRET, message, hashlib.sha256).hexdigest()
 
 # Headers
 headers = {
@@ -66,15 +54,21 @@ print()
 try:
     # GET request with the EXACT JSON string that was signed
     # CRITICAL: Use data=json_body not json=body to match signature
-    response = requests.get(url, data=json_body, headers=headers, timeout=10)
+    response = get_session().get(url, data=json_body, headers=headers, timeout=10)
     
     print(f"Status Code: {response.status_code}")
     print()
     
+    # Parse the body once; both branches below work from it
+    try:
+        data = decode_response(response)
+    except ValueError:
+        data = response.text
+    
     if response.status_code == 200:
-        data = response.json()
-        print("✅ SUCCESS! Wallet data received:")
-        print(json.dumps(data, indent=2))
+        print("✅ SUCCESS! Wallet data received")
+        if VERBOSE:
+            print(pretty(data))
         print()
         
         # Parse wallet balances
@@ -92,9 +86,8 @@ try:
             print("⚠️  Unexpected response format (not an array)")
             
     else:
-        error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text
         print(f"❌ ERROR: HTTP {response.status_code}")
-        print(json.dumps(error_data, indent=2) if isinstance(error_data, dict) else error_data)
+        print(pretty(data) if isinstance(data, dict) else data)
         
 except Exception as e:
     print(f"❌ Exception: {e}")